@@ -16,6 +16,7 @@ from .utils.display.display_utils import print_banner
 from .utils.persistence.project_utils import load_or_create_project
 from .utils.display.next_command import NextCommandSuggester
 from .models.project import Project
+from .models.finding import SEVERITY_LEVELS
 
 # Initialize colorama
 init(autoreset=True)
@@ -369,7 +370,7 @@ def create_argument_parser():
     enhance_parser.add_argument('-bs','--batch-size', type=int, default=5,
                                 help='Findings per AI batch (default: 5)')
     enhance_parser.add_argument('-s','--severity',
-                                choices=['Critical', 'High', 'Medium', 'Low', 'Info'],
+                                choices=SEVERITY_LEVELS,
                                 help='Only enhance findings of this severity')
 
     # ── setup ──────────────────────────────────────────────────────────
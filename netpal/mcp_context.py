@@ -11,6 +11,7 @@ class NetPalContext:
     nmap_available: bool = False
     nuclei_available: bool = False
     sudo_available: bool = False
+    playwright_available: bool = False
 
     def get_project(self, name: str = None):
         """Load a project by name, or the active project from config.
@@ -38,6 +39,18 @@ class NetPalContext:
 
         return project
 
+    def check_playwright(self) -> bool:
+        """Return whether Playwright's Chromium runtime can launch.
+
+        The check starts a browser, so a successful result is kept for the
+        life of the server; a failure is re-checked on the next call so an
+        install made while the server is running is picked up.
+        """
+        if not self.playwright_available:
+            from .utils.tool_paths import check_playwright_installed
+            self.playwright_available = check_playwright_installed()
+        return self.playwright_available
+
     def get_scanner(self):
         """Create a new NmapScanner instance.
 
@@ -206,22 +206,31 @@ def register_project_resources(mcp):
         if not project or not project.hosts:
             return {"targets": {}}
 
-        targets = {}
-
-        # all_discovered
-        all_hosts = list(project.hosts)
-        targets["all_discovered"] = {
-            "hosts": len(all_hosts),
-            "services": sum(len(h.services) for h in all_hosts),
+        # Project and per-asset totals come from a single walk over hosts.
+        asset_totals = {asset.asset_id: [0, 0] for asset in project.assets}
+        service_total = 0
+        for h in project.hosts:
+            service_count = len(h.services)
+            service_total += service_count
+            for asset_id in set(h.assets):
+                totals = asset_totals.get(asset_id)
+                if totals is not None:
+                    totals[0] += 1
+                    totals[1] += service_count
+
+        targets = {
+            "all_discovered": {
+                "hosts": len(project.hosts),
+                "services": service_total,
+            }
         }
 
         # Per-asset
         for asset in project.assets:
-            key = f"{asset.name}_discovered"
-            asset_hosts = [h for h in project.hosts if asset.asset_id in h.assets]
-            targets[key] = {
-                "hosts": len(asset_hosts),
-                "services": sum(len(h.services) for h in asset_hosts),
+            host_count, service_count = asset_totals[asset.asset_id]
+            targets[f"{asset.name}_discovered"] = {
+                "hosts": host_count,
+                "services": service_count,
             }
 
         return {"targets": targets}
@@ -79,7 +79,6 @@ def register_scan_tools(mcp):
         from ..utils.scanning.recon_executor import execute_recon_with_tools
         from ..utils.scanning.scan_helpers import run_discovery_phase
         from ..utils.persistence.project_persistence import save_project_to_file
-        from ..utils.tool_paths import check_playwright_installed
 
         nctx = get_netpal_ctx(ctx)
 
@@ -87,7 +86,7 @@ def register_scan_tools(mcp):
             raise RuntimeError("Privileged nmap execution is not configured.")
         if not nctx.nmap_available:
             raise RuntimeError("nmap is not installed or not found in PATH.")
-        if not check_playwright_installed():
+        if not nctx.check_playwright():
             raise RuntimeError(
                 "Playwright is not installed or its Chromium runtime cannot launch. "
                 "Run `uv run playwright install chromium` or rerun `bash install.sh`."
@@ -174,13 +173,14 @@ def register_scan_tools(mcp):
                 network_id=network_id,
             )
 
+            host_ips_list = []
             if hosts:
                 for h in hosts:
                     project.add_host(h, asset_obj.asset_id)
+                    host_ips_list.append(h.ip)
                 save_project_to_file(project)
 
-            host_count = len(hosts) if hosts else 0
-            host_ips_list = [h.ip for h in hosts] if hosts else []
+            host_count = len(host_ips_list)
 
             result = {
                 "scan_type": scan_type,
@@ -270,12 +270,11 @@ def register_scan_tools(mcp):
             save_project_to_file, save_findings_to_file,
         )
         from ..services.tools.tool_orchestrator import ToolOrchestrator as ToolRunner
-        from ..utils.tool_paths import check_playwright_installed
 
         nctx = get_netpal_ctx(ctx)
         if not nctx.nmap_available:
             raise RuntimeError("nmap is not installed or not found in PATH.")
-        if not check_playwright_installed():
+        if not nctx.check_playwright():
             raise RuntimeError(
                 "Playwright is not installed or its Chromium runtime cannot launch. "
                 "Run `uv run playwright install chromium` or rerun `bash install.sh`."
@@ -2,7 +2,7 @@
 Data models for NetPal
 """
 
-from .finding import Finding, Severity
+from .finding import Finding, Severity, SEVERITY_LEVELS
 from .service import Service
 from .host import Host
 from .asset import Asset
@@ -13,6 +13,7 @@ from .test_case_registry import TestCaseRegistry
 __all__ = [
     'Finding',
     'Severity',
+    'SEVERITY_LEVELS',
     'Service',
     'Host',
     'Asset',
@@ -36,10 +36,13 @@ class Severity(str, Enum):
         """
         if not value:
             return cls.INFO
-        for member in cls:
-            if member.value.lower() == value.strip().lower():
-                return member
-        return cls.INFO
+        return _SEVERITY_BY_LOWER.get(value.strip().lower(), cls.INFO)
+
+
+_SEVERITY_BY_LOWER = {member.value.lower(): member for member in Severity}
+
+# Severity names in display order, shared by every severity picker.
+SEVERITY_LEVELS = tuple(member.value for member in Severity)
 
 
 class Finding:
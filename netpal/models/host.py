@@ -36,6 +36,23 @@ class Host:
         self.assets = assets if assets is not None else []
         self.metadata = metadata if metadata is not None else {}
         self.network_id = network_id or "unknown"
+        # (services list, its length, {(port, protocol): svc}, {port: svc}).
+        # Services are only appended or the list replaced, so identity and
+        # length are enough to tell when the index is stale.
+        self._service_index = None
+
+    def _services_by_key(self) -> tuple[dict, dict]:
+        """Return the (port, protocol) and port lookups for ``services``."""
+        services = self.services
+        cached = self._service_index
+        if cached is None or cached[0] is not services or cached[1] != len(services):
+            by_key: dict = {}
+            by_port: dict = {}
+            for service in services:
+                by_key.setdefault((service.port, service.protocol), service)
+                by_port.setdefault(service.port, service)
+            cached = self._service_index = (services, len(services), by_key, by_port)
+        return cached[2], cached[3]
     
     def add_service(self, service: Service):
         """
@@ -45,20 +62,24 @@ class Host:
             service: Service object to add
         """
         # Check for duplicate port/protocol
-        for existing in self.services:
-            if existing.port == service.port and existing.protocol == service.protocol:
-                # Merge proofs if service already exists
-                for proof in service.proofs:
-                    existing.add_proof(
-                        proof.get("type"),
-                        proof.get("result_file"),
-                        proof.get("screenshot_file"),
-                        proof.get("raw_output"),
-                        proof.get("utc_ts")
-                    )
-                return
+        by_key, by_port = self._services_by_key()
+        existing = by_key.get((service.port, service.protocol))
+        if existing is not None:
+            # Merge proofs if service already exists
+            for proof in service.proofs:
+                existing.add_proof(
+                    proof.get("type"),
+                    proof.get("result_file"),
+                    proof.get("screenshot_file"),
+                    proof.get("raw_output"),
+                    proof.get("utc_ts")
+                )
+            return
         
         self.services.append(service)
+        by_key[(service.port, service.protocol)] = service
+        by_port.setdefault(service.port, service)
+        self._service_index = (self.services, len(self.services), by_key, by_port)
     
     def get_service(self, port: int) -> Optional[Service]:
         """
@@ -70,10 +91,7 @@ class Host:
         Returns:
             Service object or None if not found
         """
-        for service in self.services:
-            if service.port == port:
-                return service
-        return None
+        return self._services_by_key()[1].get(port)
     
     def add_finding(self, finding_id: str):
         """
@@ -47,6 +47,7 @@ class Project:
         self.hosts = []
         self.findings = []
         self.modified_utc_ts = int(time.time())
+        self._duplicate_ips_cache = None
 
     @property
     def description(self) -> str:
@@ -235,6 +236,31 @@ class Project:
         """
         return [host for host in self.hosts if host.ip == ip]
     
+    def get_duplicate_ips(self) -> frozenset[str]:
+        """
+        Get the IPs shared by more than one host (e.g. across networks).
+
+        The result is cached against the hosts list and its length: hosts
+        are only ever appended via add_host or pruned by replacing the list.
+
+        Returns:
+            Frozenset of duplicated IP addresses
+        """
+        hosts = self.hosts
+        cached = self._duplicate_ips_cache
+        if cached and cached[0] is hosts and cached[1] == len(hosts):
+            return cached[2]
+        seen = set()
+        duplicates = set()
+        for host in hosts:
+            if host.ip in seen:
+                duplicates.add(host.ip)
+            else:
+                seen.add(host.ip)
+        result = frozenset(duplicates)
+        self._duplicate_ips_cache = (hosts, len(hosts), result)
+        return result
+    
     def add_finding(self, finding: Finding):
         """
         Add a finding to the project.
@@ -6,6 +6,10 @@ import time
 from ..utils.persistence.file_utils import make_path_relative_to_scan_results, resolve_scan_results_path
 
 
+# Ports treated as HTTPS regardless of the detected service name.
+HTTPS_PORTS = frozenset({443, 8443, 4443})
+
+
 class Service:
     """
     Represents a network service running on a host.
@@ -107,7 +111,7 @@ class Service:
             'http'
         """
         # Check for HTTPS ports
-        if self.port in [443, 8443, 4443]:
+        if self.port in HTTPS_PORTS:
             return 'https'
         
         # Check service name
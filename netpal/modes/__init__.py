@@ -19,21 +19,28 @@ Subcommand handlers:
   - AutoHandler          → netpal auto
   - ExportHandler        → netpal export
 """
-from .base_handler import ModeHandler
-from .asset_create_handler import AssetCreateHandler
-from .recon_cli_handler import ReconCLIHandler
-from .recon_tools_handler import ReconToolsHandler
-from .ai_review_handler import AIReviewHandler
-from .ai_enhance_handler import AIEnhanceHandler
-from .findings_cli_handler import FindingsCLIHandler
-from .hosts_handler import HostsHandler
-from .init_handler import InitHandler
-from .list_handler import ListHandler
-from .set_handler import SetHandler
-from .project_edit_handler import ProjectEditHandler
-from .setup_handler import SetupHandler
-from .auto_handler import AutoHandler
-from .export_handler import ExportHandler
+import importlib
+
+# Handlers resolve on first access (PEP 562): the CLI imports only the
+# handler module for the subcommand being run, and that import must not
+# drag every other handler in through this package.
+_LAZY_EXPORTS = {
+    'ModeHandler': '.base_handler',
+    'AssetCreateHandler': '.asset_create_handler',
+    'ReconCLIHandler': '.recon_cli_handler',
+    'ReconToolsHandler': '.recon_tools_handler',
+    'AIReviewHandler': '.ai_review_handler',
+    'AIEnhanceHandler': '.ai_enhance_handler',
+    'FindingsCLIHandler': '.findings_cli_handler',
+    'HostsHandler': '.hosts_handler',
+    'InitHandler': '.init_handler',
+    'ListHandler': '.list_handler',
+    'SetHandler': '.set_handler',
+    'ProjectEditHandler': '.project_edit_handler',
+    'SetupHandler': '.setup_handler',
+    'AutoHandler': '.auto_handler',
+    'ExportHandler': '.export_handler',
+}
 
 __all__ = [
     'ModeHandler',
@@ -52,3 +59,12 @@ __all__ = [
     'AutoHandler',
     'ExportHandler',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -163,8 +163,7 @@ class AssetCreateHandler(ModeHandler):
             if not os.path.isfile(path):
                 return None
             with open(path, 'r') as fh:
-                lines = [l.strip() for l in fh if l.strip()]
-            return len(lines)
+                return sum(1 for line in fh if line.strip())
         except Exception:
             return None
     
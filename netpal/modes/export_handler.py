@@ -7,7 +7,6 @@ Usage:
     netpal export "PEN-TEST-1234"          # export by external ID
 """
 import os
-import shutil
 import zipfile
 from pathlib import Path
 
@@ -83,59 +82,44 @@ class ExportHandler(ModeHandler):
             print(f"  Expected: {project_dir}/")
             return False
 
-        # ── Create export directory ────────────────────────────────────
+        # ── Create export archive ──────────────────────────────────────
         exports_base = Path.cwd() / "exports"
         export_folder_name = f"{project_id}-export"
-        export_dir = exports_base / export_folder_name
+        archive_root = f"{export_folder_name}/scan_results"
 
         # Ensure exports/ exists
         os.makedirs(exports_base, exist_ok=True)
 
-        # Clean up any previous export with the same name
-        if export_dir.exists():
-            shutil.rmtree(export_dir)
-        os.makedirs(export_dir, exist_ok=True)
-
-        # Create scan_results subdirectory inside export
-        export_scan_results = export_dir / "scan_results"
-        os.makedirs(export_scan_results, exist_ok=True)
-
-        copied_count = 0
-
-        # ── Copy project JSON ──────────────────────────────────────────
-        if has_json:
-            dest = export_scan_results / f"{project_id}.json"
-            shutil.copy2(project_json, str(dest))
-            copied_count += 1
-            print(f"  {Fore.GREEN}✓{Style.RESET_ALL} {project_id}.json")
-
-        # ── Copy findings JSON ─────────────────────────────────────────
-        if has_findings:
-            dest = export_scan_results / f"{project_id}_findings.json"
-            shutil.copy2(findings_json, str(dest))
-            copied_count += 1
-            print(f"  {Fore.GREEN}✓{Style.RESET_ALL} {project_id}_findings.json")
-
-        # ── Copy project evidence directory ────────────────────────────
-        if has_dir:
-            dest_dir = export_scan_results / project_id
-            shutil.copytree(project_dir, str(dest_dir))
-            dir_file_count = sum(len(files) for _, _, files in os.walk(str(dest_dir)))
-            copied_count += dir_file_count
-            print(f"  {Fore.GREEN}✓{Style.RESET_ALL} {project_id}/ ({dir_file_count} files)")
-
-        # ── Create zip archive ─────────────────────────────────────────
         zip_path = exports_base / f"{export_folder_name}.zip"
 
         # Remove old zip if it exists
         if zip_path.exists():
             os.remove(str(zip_path))
 
-        print(f"\n  Zipping export…")
-        _zip_directory(str(export_dir), str(zip_path))
+        copied_count = 0
 
-        # ── Remove unzipped export folder ──────────────────────────────
-        shutil.rmtree(str(export_dir))
+        # Files are streamed straight into the archive under the same
+        # <id>-export/scan_results/ layout, with no staging copy on disk.
+        with zipfile.ZipFile(str(zip_path), 'w', zipfile.ZIP_DEFLATED) as zf:
+            # ── Project JSON ───────────────────────────────────────────
+            if has_json:
+                _zip_add_file(zf, project_json, f"{archive_root}/{project_id}.json")
+                copied_count += 1
+                print(f"  {Fore.GREEN}✓{Style.RESET_ALL} {project_id}.json")
+
+            # ── Findings JSON ──────────────────────────────────────────
+            if has_findings:
+                _zip_add_file(zf, findings_json, f"{archive_root}/{project_id}_findings.json")
+                copied_count += 1
+                print(f"  {Fore.GREEN}✓{Style.RESET_ALL} {project_id}_findings.json")
+
+            # ── Project evidence directory ─────────────────────────────
+            if has_dir:
+                dir_file_count = _zip_directory(
+                    project_dir, zf, f"{archive_root}/{project_id}"
+                )
+                copied_count += dir_file_count
+                print(f"  {Fore.GREEN}✓{Style.RESET_ALL} {project_id}/ ({dir_file_count} files)")
 
         # ── Present result ─────────────────────────────────────────────
         zip_abs = os.path.abspath(str(zip_path))
@@ -194,19 +178,37 @@ class ExportHandler(ModeHandler):
 
 # ── Module-level helpers ───────────────────────────────────────────────────
 
-def _zip_directory(source_dir, zip_path):
-    """Create a zip archive from a directory.
+# Already-compressed evidence (screenshots, archives) is stored as-is;
+# deflating it again costs CPU for no size gain.
+_STORED_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.webp', '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z'})
+
+
+def _zip_add_file(zf, file_path, arcname):
+    """Add one file to an open zip, skipping compression for packed formats."""
+    ext = os.path.splitext(file_path)[1].lower()
+    compress_type = zipfile.ZIP_STORED if ext in _STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+    zf.write(str(file_path), arcname, compress_type=compress_type)
+
+
+def _zip_directory(source_dir, zf, arc_prefix):
+    """Add every file under a directory to an open zip archive.
 
     Args:
         source_dir: Path to directory to zip.
-        zip_path: Destination zip file path.
+        zf: Open ``zipfile.ZipFile`` in write mode.
+        arc_prefix: Archive path the directory contents are placed under.
+
+    Returns:
+        Number of files added.
     """
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-        root = Path(source_dir)
-        for file_path in root.rglob('*'):
-            if file_path.is_file():
-                arcname = file_path.relative_to(root.parent)
-                zf.write(str(file_path), str(arcname))
+    count = 0
+    root = Path(source_dir)
+    for file_path in root.rglob('*'):
+        if file_path.is_file():
+            arcname = f"{arc_prefix}/{file_path.relative_to(root).as_posix()}"
+            _zip_add_file(zf, file_path, arcname)
+            count += 1
+    return count
 
 
 def _human_readable_size(num_bytes):
@@ -1,6 +1,7 @@
 """Handler for the 'findings' subcommand."""
 from colorama import Fore, Style
 from .base_handler import ModeHandler
+from ..models.finding import SEVERITY_LEVELS
 
 
 class FindingsCLIHandler(ModeHandler):
@@ -67,7 +68,7 @@ class FindingsCLIHandler(ModeHandler):
 
         try:
             hosts = list(self.project.hosts)
-            duplicate_ips = {host.ip for host in hosts if len(self.project.get_hosts_by_ip(host.ip)) > 1}
+            duplicate_ips = self.project.get_duplicate_ips()
 
             print(f"{Fore.CYAN}Select a host:{Style.RESET_ALL}")
             for i, host in enumerate(hosts, 1):
@@ -120,7 +121,7 @@ class FindingsCLIHandler(ModeHandler):
                 if not name.strip():
                     print(f"{Fore.RED}Finding name is required.{Style.RESET_ALL}")
 
-            severity_options = ["Critical", "High", "Medium", "Low", "Info"]
+            severity_options = SEVERITY_LEVELS
             print(f"\n{Fore.CYAN}Select severity:{Style.RESET_ALL}")
             for i, sev in enumerate(severity_options, 1):
                 print(f"  {Fore.CYAN}{i}{Style.RESET_ALL}. {sev}")
@@ -128,11 +128,7 @@ class ReconToolsHandler(ModeHandler):
 
         # When filtering by port, narrow down services
         if port_filter is not None:
-            filtered = []
-            for h in hosts_with_services:
-                if any(s.port == port_filter for s in h.services):
-                    filtered.append(h)
-            hosts_with_services = filtered
+            hosts_with_services = [h for h in hosts_with_services if h.get_service(port_filter)]
             if not hosts_with_services:
                 print(f"{Fore.YELLOW}[INFO] No hosts have port {port_filter} open.{Style.RESET_ALL}")
                 return False
@@ -298,14 +294,15 @@ class ReconToolsHandler(ModeHandler):
         # 1) all_discovered — every host in the project
         targets['all_discovered'] = list(self.project.hosts)
 
-        # 2) Per-asset discovered hosts
+        # 2) Per-asset discovered hosts, bucketed in one walk over hosts
+        hosts_by_asset = {asset.asset_id: [] for asset in self.project.assets}
+        for h in self.project.hosts:
+            for asset_id in set(h.assets):
+                bucket = hosts_by_asset.get(asset_id)
+                if bucket is not None:
+                    bucket.append(h)
         for asset in self.project.assets:
-            key = f"{asset.name}_discovered"
-            asset_hosts = [
-                h for h in self.project.hosts
-                if asset.asset_id in h.assets
-            ]
-            targets[key] = asset_hosts
+            targets[f"{asset.name}_discovered"] = list(hosts_by_asset[asset.asset_id])
 
         return targets
 
@@ -6,10 +6,16 @@ Provides modular service packages:
 - ai/ - AI-powered analysis with provider architecture
 - tools/ - Security tool execution with focused runners
 """
-from .nmap.scanner import NmapScanner
-from .xml_parser import NmapXmlParser
-from .ai.analyzer import AIAnalyzer
-from .tools.tool_orchestrator import ToolOrchestrator
+import importlib
+
+# Exports resolve on first access (PEP 562) so importing one service
+# submodule does not pull in every other service package.
+_LAZY_EXPORTS = {
+    'NmapScanner': '.nmap.scanner',
+    'NmapXmlParser': '.xml_parser',
+    'AIAnalyzer': '.ai.analyzer',
+    'ToolOrchestrator': '.tools.tool_orchestrator',
+}
 
 __all__ = [
     'NmapScanner',
@@ -17,3 +23,12 @@ __all__ = [
     'NmapXmlParser',
     'AIAnalyzer',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -244,6 +244,12 @@ Only include genuine security concerns. Return an empty array [] if no significa
             json_str = response[json_start:json_end]
             findings_data = json.loads(json_str)
             
+            # Index hosts by IP once (first host wins, as the old scan did)
+            # instead of scanning the batch for every returned finding.
+            hosts_by_ip = {}
+            for host in hosts:
+                hosts_by_ip.setdefault(host.ip, host)
+            
             # Create Finding objects
             for finding_dict in findings_data:
                 # Find the host by IP
@@ -252,27 +258,25 @@ Only include genuine security concerns. Return an empty array [] if no significa
                 host_id = None
                 proof_files = []
                 
-                for host in hosts:
-                    if host.ip == host_ip:
-                        host_id = host.host_id
-                        
-                        # Collect proof files for this port (including screenshots)
-                        if port:
-                            for service in host.services:
-                                if service.port == port:
-                                    for proof in service.proofs:
-                                        # Skip proofs with no actionable output
-                                        if not proof.get("output", True):
-                                            continue
-                                        result_file = proof.get('result_file')
-                                        screenshot_file = proof.get('screenshot_file')
-                                        
-                                        if result_file:
-                                            proof_files.append(result_file)
-                                        if screenshot_file:
-                                            proof_files.append(screenshot_file)
-                                    break
-                        break
+                host = hosts_by_ip.get(host_ip)
+                if host is not None:
+                    host_id = host.host_id
+                    
+                    # Collect proof files for this port (including screenshots)
+                    if port:
+                        service = host.get_service(port)
+                        if service is not None:
+                            for proof in service.proofs:
+                                # Skip proofs with no actionable output
+                                if not proof.get("output", True):
+                                    continue
+                                result_file = proof.get('result_file')
+                                screenshot_file = proof.get('screenshot_file')
+                                
+                                if result_file:
+                                    proof_files.append(result_file)
+                                if screenshot_file:
+                                    proof_files.append(screenshot_file)
                 
                 # Apply enhancement if requested (using optimized 1-call method)
                 if enhance_mode and self.enhancer:
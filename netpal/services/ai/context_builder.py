@@ -5,12 +5,22 @@ This module prepares host and service data for AI analysis by extracting
 relevant information from Host objects and reading proof file contents.
 """
 
+from collections import OrderedDict
 from typing import List, Dict, Optional, Callable
 import os
+import threading
 
 from ...utils.persistence.file_utils import resolve_scan_results_path
 
 
+# Truncated proof file contents keyed by (path, mtime_ns, size, max_chars).
+# Re-running AI review over unchanged evidence reuses the text instead of
+# reading the files again. Bounded to keep memory flat.
+_PROOF_READ_CACHE_MAX = 512
+_PROOF_READ_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_PROOF_READ_CACHE_LOCK = threading.Lock()
+
+
 class ContextBuilder:
     """
     Builds analysis context from hosts.
@@ -195,14 +205,23 @@ class ContextBuilder:
         """
         try:
             resolved_path = resolve_scan_results_path(file_path)
-            if not os.path.exists(resolved_path):
-                return None
+            stat = os.stat(resolved_path)
+            key = (resolved_path, stat.st_mtime_ns, stat.st_size, max_chars)
+            with _PROOF_READ_CACHE_LOCK:
+                cached = _PROOF_READ_CACHE.get(key)
+                if cached is not None:
+                    _PROOF_READ_CACHE.move_to_end(key)
+                    return cached
             
             with open(resolved_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read(max_chars)
                 if len(content) == max_chars:
                     content += "... [truncated]"
-                return content
+            with _PROOF_READ_CACHE_LOCK:
+                _PROOF_READ_CACHE[key] = content
+                if len(_PROOF_READ_CACHE) > _PROOF_READ_CACHE_MAX:
+                    _PROOF_READ_CACHE.popitem(last=False)
+            return content
         except Exception:
             return None
     
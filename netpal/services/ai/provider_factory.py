@@ -17,6 +17,27 @@ from .providers import (
 )
 
 
+# ai_type -> ProviderFactory creator method name
+_PROVIDER_CREATORS = {
+    'aws': '_create_bedrock',
+    'anthropic': '_create_anthropic',
+    'openai': '_create_openai',
+    'ollama': '_create_ollama',
+    'azure': '_create_azure',
+    'gemini': '_create_gemini',
+}
+
+# ai_type -> config keys that must be set
+_PROVIDER_REQUIREMENTS = {
+    'aws': ('ai_aws_profile',),
+    'anthropic': ('ai_anthropic_token',),
+    'openai': ('ai_openai_token',),
+    'ollama': (),  # Ollama has no required config (uses defaults)
+    'azure': ('ai_azure_token', 'ai_azure_endpoint', 'ai_azure_model'),
+    'gemini': ('ai_gemini_token',),
+}
+
+
 class ProviderFactory:
     """
     Factory for creating AI provider clients.
@@ -41,21 +62,12 @@ class ProviderFactory:
         ai_type = config.get('ai_type', 'aws')
         
         # Route to appropriate provider creator
-        creator_map = {
-            'aws': ProviderFactory._create_bedrock,
-            'anthropic': ProviderFactory._create_anthropic,
-            'openai': ProviderFactory._create_openai,
-            'ollama': ProviderFactory._create_ollama,
-            'azure': ProviderFactory._create_azure,
-            'gemini': ProviderFactory._create_gemini
-        }
-        
-        creator = creator_map.get(ai_type)
-        if not creator:
+        creator_name = _PROVIDER_CREATORS.get(ai_type)
+        if not creator_name:
             print(f"Unknown AI type: {ai_type}")
             return None
         
-        return creator(config)
+        return getattr(ProviderFactory, creator_name)(config)
     
     @staticmethod
     def _create_bedrock(config: Dict) -> Optional[BedrockProvider]:
@@ -223,14 +235,7 @@ class ProviderFactory:
         Returns:
             Dictionary mapping provider types to required config keys
         """
-        return {
-            'aws': ['ai_aws_profile'],
-            'anthropic': ['ai_anthropic_token'],
-            'openai': ['ai_openai_token'],
-            'ollama': [],  # Ollama has no required config (uses defaults)
-            'azure': ['ai_azure_token', 'ai_azure_endpoint', 'ai_azure_model'],
-            'gemini': ['ai_gemini_token']
-        }
+        return {ai_type: list(keys) for ai_type, keys in _PROVIDER_REQUIREMENTS.items()}
     
     @staticmethod
     def validate_config(config: Dict) -> tuple:
@@ -244,7 +249,7 @@ class ProviderFactory:
             Tuple of (is_valid: bool, error_message: str or None)
         """
         ai_type = config.get('ai_type', 'aws')
-        requirements = ProviderFactory.get_provider_requirements()
+        requirements = _PROVIDER_REQUIREMENTS
         
         if ai_type not in requirements:
             return False, f"Invalid ai_type '{ai_type}'. Must be one of: {', '.join(requirements.keys())}"
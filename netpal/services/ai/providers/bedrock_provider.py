@@ -4,11 +4,17 @@ AWS Bedrock AI provider implementation.
 Provides access to Claude models via AWS Bedrock service.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import json
 from ..base_provider import BaseAIProvider
 
 
+# bedrock-runtime clients keyed by (profile, region).  Building a boto3
+# session and client parses the service model and sets up signers, so
+# reuse one per credential/region pair for the life of the process.
+_BEDROCK_CLIENTS: Dict[Tuple[str, str], Any] = {}
+
+
 class BedrockProvider(BaseAIProvider):
     """
     AWS Bedrock provider for Claude models.
@@ -51,11 +57,18 @@ class BedrockProvider(BaseAIProvider):
     
     def _initialize_client(self):
         """Initialize boto3 Bedrock client with safe credential handling."""
+        key = (self.profile, self.region)
+        cached = _BEDROCK_CLIENTS.get(key)
+        if cached is not None:
+            self.client = cached
+            return
+        
         try:
             from ....utils.aws.aws_utils import create_safe_boto3_session
             
             session = create_safe_boto3_session(self.profile, self.region)
             self.client = session.client('bedrock-runtime', region_name=self.region)
+            _BEDROCK_CLIENTS[key] = self.client
             
         except Exception as e:
             print(f"Error initializing Bedrock client: {e}")
@@ -53,6 +53,22 @@ class GeminiProvider(BaseAIProvider):
             print(f"Error initializing Gemini client: {e}")
             self.client = None
     
+    def _load_images(self, paths: List[str]) -> List[Dict]:
+        """
+        Load images as raw bytes.
+        
+        Gemini takes binary image parts, so base64-encoding here would only
+        be decoded again in ``ImageFormatter.format_for_gemini``.
+        
+        Args:
+            paths: List of image file paths
+            
+        Returns:
+            List of image dictionaries with raw bytes
+        """
+        from ....utils.image_loader import load_images_as_bytes
+        return load_images_as_bytes(paths, max_images=5)
+    
     def _build_message_content(self, prompt: str, images: List[Dict]) -> Any:
         """
         Build Gemini-specific message content.
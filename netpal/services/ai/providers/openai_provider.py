@@ -5,9 +5,15 @@ Provides access to GPT models via OpenAI's API.
 """
 
 from typing import List, Dict, Any
+import hashlib
 from ..base_provider import BaseAIProvider
 
 
+# OpenAI clients keyed by a hash of the API key.  Each client owns an
+# HTTP connection pool and TLS context, so reuse it across providers.
+_OPENAI_CLIENTS: Dict[str, Any] = {}
+
+
 class OpenAIProvider(BaseAIProvider):
     """
     OpenAI provider for GPT models.
@@ -46,9 +52,16 @@ class OpenAIProvider(BaseAIProvider):
     
     def _initialize_client(self):
         """Initialize OpenAI client."""
+        key = hashlib.sha256((self.api_key or "").encode()).hexdigest()
+        cached = _OPENAI_CLIENTS.get(key)
+        if cached is not None:
+            self.client = cached
+            return
+        
         try:
             from openai import OpenAI
             self.client = OpenAI(api_key=self.api_key)
+            _OPENAI_CLIENTS[key] = self.client
         except Exception as e:
             print(f"Error initializing OpenAI client: {e}")
             self.client = None
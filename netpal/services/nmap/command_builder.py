@@ -8,6 +8,26 @@ from typing import List, Optional, Tuple
 from ...utils.config_loader import ConfigLoader
 from ...utils.validation import get_nmap_base_command
 
+_HTTP_PORTS = '80,443,593,808,3000,4443,5800,5801,7443,7627,8000,8003,8008,8080,8443,8888'
+_NETSEC_PORTS = (
+    '21,22,23,25,53,80,110,111,135,139,143,389,443,445,631,636,993,995,'
+    '1723,3268,3306,3389,5900,7070,8080,11211'
+)
+
+# Built-in scan types (and their legacy aliases) mapped to nmap flags.
+_SCAN_TYPE_FLAGS = {
+    "ping": ('-sn',),
+    "nmap-discovery": ('-sn',),
+    "top100": ('--top-ports', '100', '-sV'),
+    "top1000": ('--top-ports', '1000', '-sV'),
+    "http_ports": ('-p', _HTTP_PORTS, '-sV'),
+    "http": ('-p', _HTTP_PORTS, '-sV'),
+    "netsec_known": ('-p', _NETSEC_PORTS, '-sV'),
+    "netsec": ('-p', _NETSEC_PORTS, '-sV'),
+    "all_ports": ('-p-', '-sV'),
+    "allports": ('-p-', '-sV'),
+}
+
 
 class NmapCommandBuilder:
     """
@@ -48,26 +68,9 @@ class NmapCommandBuilder:
         Returns:
             Self for method chaining
         """
-        if scan_type in {"ping", "nmap-discovery"}:
-            self.cmd.extend(['-sn'])
-        elif scan_type == "top100":
-            self.cmd.extend(['--top-ports', '100', '-sV'])
-        elif scan_type == "top1000":
-            self.cmd.extend(['--top-ports', '1000', '-sV'])
-        elif scan_type in {"http_ports", "http"}:
-            self.cmd.extend([
-                '-p', 
-                '80,443,593,808,3000,4443,5800,5801,7443,7627,8000,8003,8008,8080,8443,8888', 
-                '-sV'
-            ])
-        elif scan_type in {"netsec_known", "netsec"}:
-            self.cmd.extend([
-                '-p', 
-                '21,22,23,25,53,80,110,111,135,139,143,389,443,445,631,636,993,995,1723,3268,3306,3389,5900,7070,8080,11211',
-                '-sV'
-            ])
-        elif scan_type in {"all_ports", "allports"}:
-            self.cmd.extend(['-p-', '-sV'])
+        flags = _SCAN_TYPE_FLAGS.get(scan_type)
+        if flags is not None:
+            self.cmd.extend(flags)
         elif scan_type == "custom" and custom_ports:
             self.cmd.extend(['-p', custom_ports, '-sV'])
         else:
@@ -4,6 +4,7 @@ Nmap scanner service with sequential execution and chunking support.
 import subprocess
 import os
 import time
+from collections import deque
 from typing import List, Tuple, Callable, Optional
 
 from ...utils.network_utils import break_network_into_subnets
@@ -440,8 +441,9 @@ class NmapScanner:
             # Track active process
             self.active_processes.append(process)
             
-            # Read output synchronously — one line at a time
-            output_lines = []
+            # Read output synchronously — one line at a time.  Only the tail
+            # is reported on failure, so long scans are not kept in memory.
+            output_lines = deque(maxlen=10)
             interface_error = False
             for line in process.stdout:
                 if callback:
@@ -488,7 +490,7 @@ class NmapScanner:
             if return_code != 0:
                 error_msg = f"Scan failed with return code {return_code}"
                 if output_lines:
-                    error_msg += f"\nOutput: {''.join(output_lines[-10:])}"  # Last 10 lines
+                    error_msg += f"\nOutput: {''.join(output_lines)}"  # Last 10 lines
                 return [], error_msg
 
             return [], None
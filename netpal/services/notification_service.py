@@ -2,12 +2,14 @@
 Webhook notification service for scan completion
 """
 import logging
-import requests
 from datetime import datetime
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Webhook error pages can be whole HTML documents; logs keep only the start.
+_LOGGED_BODY_CHARS = 500
+
 
 class NotificationService:
     """
@@ -151,6 +153,8 @@ class NotificationService:
             logger.debug("Sending %s webhook to %s", self.webhook_type, self.webhook_url)
             logger.debug("Payload: %s", payload)
             
+            import requests
+            
             response = requests.post(
                 self.webhook_url,
                 json=payload,
@@ -158,11 +162,13 @@ class NotificationService:
             )
             
             logger.debug("Webhook response status: %d", response.status_code)
-            logger.debug("Response body: %s", response.text)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response body: %s", response.text[:_LOGGED_BODY_CHARS])
             
             if not (200 <= response.status_code < 300):
                 logger.warning(
-                    "Webhook returned HTTP %d: %s", response.status_code, response.text
+                    "Webhook returned HTTP %d: %s",
+                    response.status_code, response.text[:_LOGGED_BODY_CHARS]
                 )
                 return False
             
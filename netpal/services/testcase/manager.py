@@ -7,6 +7,10 @@ from ...utils.persistence.file_utils import load_json, save_json
 from ...utils.persistence.project_paths import get_base_scan_results_dir
 
 
+# Test case counts keyed by registry path -> ((mtime_ns, size), count).
+_COUNT_CACHE: dict[str, tuple[tuple[int, int], int]] = {}
+
+
 class TestCaseManager:
     """Orchestrate local testcase loading, merge, querying, and persistence."""
 
@@ -26,6 +30,23 @@ class TestCaseManager:
             return TestCaseRegistry.from_dict(data)
         return TestCaseRegistry(project_id=project_id)
 
+    def count_test_cases(self, project_id: str) -> int:
+        """Return the number of registered test cases, reusing the last count
+        until the registry file changes on disk."""
+        path = self._registry_path(project_id)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            _COUNT_CACHE.pop(path, None)
+            return 0
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _COUNT_CACHE.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+        count = len(self.get_registry(project_id).test_cases)
+        _COUNT_CACHE[path] = (signature, count)
+        return count
+
     def load_test_cases(self, project, csv_path: str = "") -> dict:
         from .csv_loader import CSVLoader
 
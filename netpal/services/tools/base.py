@@ -10,7 +10,8 @@ import shlex
 import subprocess
 import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from ...models.host import Host
 from ...models.service import Service
 from ...models.finding import Finding
@@ -20,6 +21,20 @@ from ...utils.config_loader import get_user_agent
 from ...utils.tool_paths import get_go_tool_path
 
 
+# Single-pass matcher for every auto-tool placeholder, including indexed
+# ``{domainN}`` labels.
+_PLACEHOLDER_RE = re.compile(
+    r"\{(ip|port|protocol|path|domain_dn|domain|username|password|domain(\d+))\}"
+)
+_DOMAIN_INDEX_RE = re.compile(r"\{domain(\d+)\}")
+
+
+@lru_cache(maxsize=256)
+def _split_command_template(command_template: str) -> Tuple[str, ...]:
+    """Tokenize an auto-tool command template once per distinct template."""
+    return tuple(shlex.split(command_template))
+
+
 class ToolExecutionResult:
     """Standardized result format for all tool executions.
     
@@ -252,7 +267,7 @@ class BaseToolRunner(ABC):
         uses_domain_placeholders = (
             "{domain}" in command_template
             or "{domain_dn}" in command_template
-            or re.search(r"\{domain(\d+)\}", command_template) is not None
+            or _DOMAIN_INDEX_RE.search(command_template) is not None
         )
         if uses_domain_placeholders:
             domain = self._resolve_ad_domain(host, project_domain)
@@ -299,29 +314,26 @@ class BaseToolRunner(ABC):
         }
 
         try:
-            template_args = shlex.split(command_template)
+            template_args = _split_command_template(command_template)
         except ValueError as e:
             raise ValueError(f"Failed to parse command template: {e}") from e
 
-        rendered_args = []
-        for token in template_args:
-            has_domain_index = re.search(r"\{domain(\d+)\}", token) is not None
-            rendered = token
-            for key, value in values.items():
-                rendered = rendered.replace(f"{{{key}}}", value)
-
-            def _replace_domain_index(match: re.Match[str]) -> str:
-                idx = int(match.group(1))
-                if idx >= len(domain_parts):
-                    raise ValueError(
-                        f"Placeholder {{domain{idx}}} requested, but domain "
-                        f"{safe_domain!r} only has {len(domain_parts)} part(s)"
-                    )
-                return domain_parts[idx]
+        def _substitute(match: re.Match[str]) -> str:
+            index = match.group(2)
+            if index is None:
+                return values[match.group(1)]
+            idx = int(index)
+            if idx >= len(domain_parts):
+                raise ValueError(
+                    f"Placeholder {{domain{idx}}} requested, but domain "
+                    f"{safe_domain!r} only has {len(domain_parts)} part(s)"
+                )
+            return domain_parts[idx]
 
-            if has_domain_index:
-                rendered = re.sub(r"\{domain(\d+)\}", _replace_domain_index, rendered)
-            rendered_args.append(rendered)
+        rendered_args = [
+            _PLACEHOLDER_RE.sub(_substitute, token) if "{" in token else token
+            for token in template_args
+        ]
 
         return rendered_args
 
@@ -6,6 +6,8 @@ into Finding objects for the project.
 """
 import json
 import os
+import subprocess
+import threading
 from typing import List, Optional
 from .base import BaseToolRunner, ToolExecutionResult
 from ...models.host import Host
@@ -89,8 +91,9 @@ class NucleiRunner(BaseToolRunner):
         try:
             if callback:
                 callback(f"[NUCLEI] {' '.join(cmd)}\n")
-            
-            self._run_subprocess(cmd, timeout=300)
+                self._run_streaming(cmd, callback, timeout=300)
+            else:
+                self._run_subprocess(cmd, timeout=300)
             
             # Parse nuclei output into findings
             findings = self._parse_nuclei_output(output_file, host.host_id)
@@ -112,6 +115,66 @@ class NucleiRunner(BaseToolRunner):
                 )
             return ToolExecutionResult.error_result(f"Error running nuclei: {e}")
     
+    def _run_streaming(self, cmd: list, callback, timeout: int = 300) -> int:
+        """Run nuclei and report each match through *callback* as it lands.
+
+        With ``-silent -jsonl`` nuclei prints one JSON object per match on
+        stdout, so matches reach the UI during the scan rather than only
+        once it finishes.  A timer kills the scan after *timeout* seconds.
+
+        Returns:
+            The nuclei exit code
+
+        Raises:
+            subprocess.TimeoutExpired: If the scan exceeds *timeout*
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+            bufsize=1,
+        )
+        timed_out = threading.Event()
+
+        def _kill():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, _kill)
+        timer.daemon = True
+        timer.start()
+        try:
+            for line in process.stdout:
+                line = line.strip()
+                if line:
+                    callback(self._format_match(line))
+            return_code = process.wait()
+        finally:
+            timer.cancel()
+            # A failing callback leaves nuclei blocked on a full stdout pipe.
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return return_code
+
+    @staticmethod
+    def _format_match(line: str) -> str:
+        """Summarise one nuclei JSONL match as a single output line."""
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            data = None
+        if not isinstance(data, dict):
+            return f"{line}\n"
+        severity = data.get('info', {}).get('severity', 'info')
+        return f"[NUCLEI] [{severity}] {data.get('template-id', '')} {data.get('matched-at', '')}\n"
+
     def _parse_nuclei_output(self, output_file: str, host_id: str) -> List[Finding]:
         """Parse nuclei JSONL output into Finding objects.
         
@@ -15,6 +15,41 @@ from ...models.host import Host
 from ...models.service import Service
 
 
+# Set once the driver has passed its smoke test.  Only success is
+# remembered: a failure (e.g. Chromium still installing, a slow start)
+# is re-probed on the next job instead of disabling Playwright for the
+# life of a long-running TUI, web or MCP process.
+_driver_healthy = False
+
+
+def _playwright_driver_healthy() -> bool:
+    """Smoke-test the bundled Playwright ``node`` driver until it passes.
+
+    A ToolOrchestrator (and so a PlaywrightRunner) is built for every
+    tools/recon job, so remembering a pass keeps repeat jobs from paying
+    for another subprocess.
+    """
+    global _driver_healthy
+    if _driver_healthy:
+        return True
+    try:
+        import playwright
+        driver_dir = os.path.join(os.path.dirname(playwright.__file__), "driver")
+        node_bin = os.path.join(driver_dir, "node")
+        if not os.path.isfile(node_bin):
+            # Fallback: assume healthy if we can't locate the binary
+            _driver_healthy = True
+            return True
+        proc = subprocess.run(
+            [node_bin, "--version"],
+            capture_output=True, timeout=10,
+        )
+        _driver_healthy = proc.returncode == 0
+        return _driver_healthy
+    except Exception:
+        return False
+
+
 class PlaywrightRunner(BaseToolRunner):
     """Runs Playwright to capture HTTP responses and screenshots.
 
@@ -30,9 +65,15 @@ class PlaywrightRunner(BaseToolRunner):
 
     def __init__(self, project_id: str, config: dict):
         super().__init__(project_id, config)
-        self.web_ports = config.get('web_ports', [80, 443])
-        self.web_services = config.get('web_services', ['http', 'https'])
-        self._driver_ok: Optional[bool] = None
+        # Hashed port set and pre-lowered names: can_run_on_service runs
+        # for every discovered service.
+        self.web_ports = frozenset(config.get('web_ports', [80, 443]))
+        self.web_services = tuple(
+            str(svc).lower() for svc in config.get('web_services', ['http', 'https'])
+        )
+        # Verdict per raw nmap service name; a scan only ever sees a handful
+        # of distinct names, so each is lowered and matched once.
+        self._web_name_cache: dict[str, bool] = {}
 
     def is_installed(self) -> bool:
         """Check if Playwright and its Chromium browser are installed."""
@@ -63,29 +104,10 @@ class PlaywrightRunner(BaseToolRunner):
         smoke-test so we can skip Playwright gracefully instead of
         crashing inside the context-manager.
 
-        The result is cached in ``self._driver_ok`` so the check only
-        runs once per orchestrator lifetime.
+        A passing result is cached per process (see
+        ``_playwright_driver_healthy``); failures are checked again.
         """
-        if self._driver_ok is not None:
-            return self._driver_ok
-
-        try:
-            import playwright
-            driver_dir = os.path.join(os.path.dirname(playwright.__file__), "driver")
-            node_bin = os.path.join(driver_dir, "node")
-            if not os.path.isfile(node_bin):
-                # Fallback: assume healthy if we can't locate the binary
-                self._driver_ok = True
-                return True
-            proc = subprocess.run(
-                [node_bin, "--version"],
-                capture_output=True, timeout=10,
-            )
-            self._driver_ok = proc.returncode == 0
-        except Exception:
-            self._driver_ok = False
-
-        return self._driver_ok
+        return _playwright_driver_healthy()
 
     def _detect_protocol(self, host_ip: str, port: int, timeout: float = 5.0) -> str:
         """Detect whether a service speaks HTTPS or plain HTTP.
@@ -124,13 +146,16 @@ class PlaywrightRunner(BaseToolRunner):
         if service.port in self.web_ports:
             return True
 
-        if service.service_name:
-            service_lower = service.service_name.lower()
-            for web_svc in self.web_services:
-                if web_svc.lower() in service_lower:
-                    return True
+        name = service.service_name
+        if not name:
+            return False
 
-        return False
+        is_web = self._web_name_cache.get(name)
+        if is_web is None:
+            service_lower = name.lower()
+            is_web = any(web_svc in service_lower for web_svc in self.web_services)
+            self._web_name_cache[name] = is_web
+        return is_web
 
     def execute(
         self,
@@ -233,15 +258,15 @@ class PlaywrightRunner(BaseToolRunner):
                     )
 
                 # Capture response data
-                status = response.status if response else 0
-                headers = response.all_headers() if response else {}
+                status, headers = (
+                    (response.status, response.all_headers()) if response else (0, {})
+                )
                 html_content = page.content()
 
                 # Write response file (status + headers + body)
                 with open(result_file, 'w', encoding='utf-8') as f:
                     f.write(f"HTTP Response Status: {status}, URL: {url}\n")
-                    for header, value in headers.items():
-                        f.write(f"{header}: {value}\n")
+                    f.write("".join(f"{header}: {value}\n" for header, value in headers.items()))
                     f.write(html_content)
 
                 # Take full-page screenshot
@@ -412,15 +437,15 @@ class PlaywrightRunner(BaseToolRunner):
                     )
 
                 # Capture response data
-                status = response.status if response else 0
-                headers = response.all_headers() if response else {}
+                status, headers = (
+                    (response.status, response.all_headers()) if response else (0, {})
+                )
                 html_content = page.content()
 
                 # Write HTTP response file
                 with open(http_file, 'w', encoding='utf-8') as f:
                     f.write(f"HTTP Response Status: {status}, URL: {url}\n")
-                    for header, value in headers.items():
-                        f.write(f"{header}: {value}\n")
+                    f.write("".join(f"{header}: {value}\n" for header, value in headers.items()))
                     f.write(html_content)
 
                 # Take screenshot
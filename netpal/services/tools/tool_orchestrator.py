@@ -8,6 +8,7 @@ and result collection.
 import hashlib
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional
 from .playwright_runner import PlaywrightRunner
 from .nuclei_runner import NucleiRunner
@@ -25,9 +26,9 @@ class ToolOrchestrator:
     Manages the tool execution workflow:
     1. Run Playwright first for web services (provides response data)
     2. Match configured exploit tools against service port/name
-    3. Execute matching tools in order (nmap_custom, command_custom,
-       http_custom, nuclei)
-    4. Collect and return all results
+    3. Execute matching tools (nmap_custom, command_custom, http_custom,
+       nuclei) one at a time, or up to ``auto_tool_workers`` at once
+    4. Collect and return all results in configuration order
     
     Args:
         project_id: Project UUID for output paths
@@ -43,6 +44,13 @@ class ToolOrchestrator:
         self.nmap_script = NmapScriptRunner(project_id, config)
         self.command_custom = CommandToolRunner(project_id, config)
         self.http_custom = HttpCustomToolRunner(project_id, config)
+
+        # Auto-tools run sequentially unless auto_tool_workers opts in to
+        # running several against the same service at once.
+        try:
+            self.max_workers = max(1, int((config or {}).get("auto_tool_workers", 1)))
+        except (TypeError, ValueError):
+            self.max_workers = 1
     
     def execute_tools_for_service(
         self,
@@ -130,6 +138,7 @@ class ToolOrchestrator:
             service.port, service.service_name, exploit_tools
         )
         
+        pending_runs = []
         for tool in matching_tools:
             tool_runs = self._build_tool_runs(tool, auto_tool_credentials or [])
             if not tool_runs:
@@ -165,12 +174,31 @@ class ToolOrchestrator:
                         )
                     continue
 
-                tool_result = self._execute_configured_tool(
+                pending_runs.append(run_tool)
+
+        def _run(run_tool):
+            # A failing tool must not take the other runs' results with it.
+            try:
+                return self._execute_configured_tool(
                     run_tool, host, service, asset_identifier,
                     pw_result_file, callback, project_domain
                 )
-                if tool_result:
-                    results.append(tool_result)
+            except Exception as e:
+                if callback:
+                    callback(
+                        f"\n[ERROR] {self._tool_run_label(run_tool)} failed on "
+                        f"{host.ip}:{service.port}: {e}\n"
+                    )
+                return None
+
+        if self.max_workers > 1 and len(pending_runs) > 1:
+            workers = min(self.max_workers, len(pending_runs))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                tool_results = list(pool.map(_run, pending_runs))
+        else:
+            tool_results = [_run(run_tool) for run_tool in pending_runs]
+
+        results.extend(tool_result for tool_result in tool_results if tool_result)
         
         return results
 
@@ -343,7 +371,7 @@ class ToolOrchestrator:
             exploit_tools: List of tool configuration dictionaries
             
         Returns:
-            List of matching tool configurations
+            List of matching tool configurations, in configuration order
         """
         matches = []
         
@@ -24,10 +24,21 @@ class NmapXmlParser:
         Returns:
             List of Host objects
         """
+        # Hosts are handed over one <host> element at a time as the file is
+        # read, so large scan outputs never materialise as a single tree.
+        hosts = []
+
+        def _collect_host(path, item):
+            if path[-1][0] == 'host' and isinstance(item, dict):
+                host = NmapXmlParser._parse_host_data(item, network_id)
+                if host:
+                    hosts.append(host)
+            return True
+
         try:
-            with open(xml_path, 'r') as f:
-                xml_content = f.read()
-            return NmapXmlParser.parse_xml_string(xml_content, network_id)
+            with open(xml_path, 'rb') as f:
+                xmltodict.parse(f, item_depth=2, item_callback=_collect_host)
+            return hosts
         except Exception as e:
             print(f"Error parsing XML file {xml_path}: {e}")
             return []
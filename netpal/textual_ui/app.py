@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+from collections import Counter
 
 from textual import events, on, work
 from textual.app import App, ComposeResult
@@ -51,10 +52,12 @@ from .helpers import (
     VIEW_SETTINGS,
     VIEW_TESTCASES,
     VIEW_TOOLS,
+    _BatchedLogWriter,
     _busy_button,
     _build_starter_asset_name,
     _capture_logger_to_richlog,
     _duplicate_ip_set,
+    _fill_table,
     _get_interfaces_with_valid_ips,
     _get_path_suggestions,
     _get_testcase_manager,
@@ -69,10 +72,13 @@ from .helpers import (
     _save_config,
     _save_settings_document,
     _set_active_project,
+    _set_select_options,
     _severity_color,
     _starter_asset_target_prompt,
+    _write_log_lines,
 )
 from .theme import APP_CSS
+from ..models.finding import SEVERITY_LEVELS
 
 
 def _format_metric_line(*parts: str) -> str:
@@ -84,6 +90,7 @@ AUTO_TOOL_CREDENTIAL_TYPE_OPTIONS = [
     ("Domain", "domain"),
     ("Web", "web"),
 ]
+_CREDENTIAL_TYPE_LABELS = {value: label for label, value in AUTO_TOOL_CREDENTIAL_TYPE_OPTIONS}
 
 _PROJECT_STATE_UNSET = object()
 _MEDIUM_NAV_LABELS = {
@@ -120,11 +127,7 @@ def _normalize_credential_type(value: str) -> str:
 
 
 def _credential_type_label(value: str) -> str:
-    return {
-        "all": "All",
-        "domain": "Domain",
-        "web": "Web",
-    }.get(_normalize_credential_type(value), "All")
+    return _CREDENTIAL_TYPE_LABELS[_normalize_credential_type(value)]
 
 
 def _credential_password_mask(password: str) -> str:
@@ -644,13 +647,7 @@ class CreateFindingScreen(StandardModalScreen):
             (_host_label(host, duplicate_ips), host.host_id)
             for host in sorted(self._project.hosts, key=lambda host: (host.ip, getattr(host, "network_id", "unknown")))
         ]
-        severity_options = [
-            ("Critical", "Critical"),
-            ("High", "High"),
-            ("Medium", "Medium"),
-            ("Low", "Low"),
-            ("Info", "Info"),
-        ]
+        severity_options = [(severity, severity) for severity in SEVERITY_LEVELS]
 
         with VerticalScroll(classes="modal-shell modal-wide compact-form"):
             yield Static("Create Finding", classes="section-title")
@@ -918,7 +915,7 @@ class ProjectsView(BaseNetPalView):
         project = self.app.project
         if project and project.name == active:
             service_count = sum(len(host.services) for host in project.hosts)
-            testcase_count = len(_get_testcase_manager().get_registry(project.project_id).test_cases)
+            testcase_count = _get_testcase_manager().count_test_cases(project.project_id)
             lines = [
                 f"[bold]{project.name}[/]",
                 f"Project ID: {project.project_id}",
@@ -1305,7 +1302,7 @@ class ReconView(BaseNetPalView):
         project = self.app.project
         select = self.query_one("#recon-asset", Select)
         if not project:
-            select.set_options([])
+            _set_select_options(self, select, [])
             return
 
         options: list[tuple[str, str]] = []
@@ -1313,10 +1310,12 @@ class ReconView(BaseNetPalView):
         if all_hosts:
             options.append((f"All Discovered Hosts ({len(all_hosts)})", "__ALL_DISCOVERED__"))
 
+        # Count hosts per asset in one pass instead of once per asset.
+        asset_host_counts = Counter(asset_id for host in all_hosts for asset_id in set(host.assets))
         for asset in project.assets:
-            asset_hosts = [host for host in project.hosts if asset.asset_id in host.assets]
-            if asset_hosts:
-                options.append((f"Discovered: {asset.name} ({len(asset_hosts)} hosts)", f"__DISCOVERED_ASSET__:{asset.name}"))
+            host_count = asset_host_counts.get(asset.asset_id)
+            if host_count:
+                options.append((f"Discovered: {asset.name} ({host_count} hosts)", f"__DISCOVERED_ASSET__:{asset.name}"))
 
         for asset in project.assets:
             options.append((f"Asset: {asset.name}", f"__ASSET__:{asset.name}"))
@@ -1330,7 +1329,7 @@ class ReconView(BaseNetPalView):
         for info in list_chunk_files(project.project_id, project.assets):
             options.append((f"Chunk: {info['stem']} ({info['ip_count']} hosts)", f"__CHUNK__:{info['asset'].name}:{info['stem']}"))
 
-        select.set_options(options)
+        _set_select_options(self, select, options)
 
     @on(Select.Changed, "#recon-scan-type")
     def _handle_scan_type_changed(self, event: Select.Changed) -> None:
@@ -1434,6 +1433,7 @@ class ReconView(BaseNetPalView):
             self.app.call_from_thread(log.write, f"[bold yellow]Starting {scan_type} scan on {target_label}...[/]")
 
             config = self.app.config
+            output_cb = _BatchedLogWriter(self.app, log)
 
             try:
                 import time as _time
@@ -1457,9 +1457,6 @@ class ReconView(BaseNetPalView):
                 initial_host_count = len(project.hosts)
                 initial_service_count = sum(len(host.services) for host in project.hosts)
 
-                def output_cb(line):
-                    self.app.call_from_thread(log.write, line.rstrip())
-
                 def _save_proj():
                     save_project_to_file(project)
 
@@ -1539,17 +1536,20 @@ class ReconView(BaseNetPalView):
                         output_cb,
                         network_id=network_context.network_id,
                     )
+                output_cb.flush()
 
                 if not all_ips:
                     if error:
                         self.app.call_from_thread(log.write, f"[bold red]Error: {error}[/]")
                     elif hosts:
+                        hosts_with_services = []
                         for host in hosts:
                             project.add_host(host, asset.asset_id)
+                            if host.services:
+                                hosts_with_services.append(host)
                         _save_proj()
                         self.app.call_from_thread(log.write, f"\n[bold green]Scan complete - {len(hosts)} host(s) found[/]")
 
-                        hosts_with_services = [host for host in hosts if host.services]
                         if run_tools and hosts_with_services and not ConfigLoader.is_discovery_scan(str(scan_type)):
                             self.app.call_from_thread(log.write, "\n[bold cyan]Running exploit tools on discovered services...[/]")
                             exploit_tools = ConfigLoader.load_exploit_tools()
@@ -1565,6 +1565,7 @@ class ReconView(BaseNetPalView):
                                 _save_find,
                                 rerun_autotools=rerun_autotools,
                             )
+                            output_cb.flush()
                             self.app.call_from_thread(log.write, "[bold green]Auto-tools complete[/]")
 
                 if hosts:
@@ -1594,6 +1595,7 @@ class ReconView(BaseNetPalView):
                 else:
                     self.app.call_from_thread(log.write, "[yellow]No hosts found.[/]")
             except Exception as exc:
+                output_cb.flush()
                 self.app.call_from_thread(log.write, f"[bold red]Error: {exc}[/]")
 
     def _post_scan_refresh(self) -> None:
@@ -1658,30 +1660,37 @@ class ToolsView(BaseNetPalView):
         project = self.app.project
         select = self.query_one("#tools-target", Select)
         if not project:
-            select.set_options([])
+            _set_select_options(self, select, [])
             return
 
         options: list[tuple[str, str]] = []
         duplicate_ips = _duplicate_ip_set(project)
 
+        # Tally host/service counts per asset in one pass over the hosts
+        # instead of rescanning every host for each asset option.
         all_hosts = project.hosts
+        service_count = 0
+        asset_totals: dict[int, list[int]] = {}
+        for host in all_hosts:
+            host_services = len(host.services)
+            service_count += host_services
+            for asset_id in set(host.assets):
+                totals = asset_totals.setdefault(asset_id, [0, 0])
+                totals[0] += 1
+                totals[1] += host_services
         if all_hosts:
-            service_count = sum(len(host.services) for host in all_hosts)
             options.append((f"All Discovered ({len(all_hosts)} hosts, {service_count} svc)", "all_discovered"))
 
         for asset in project.assets:
-            asset_hosts = [host for host in project.hosts if asset.asset_id in host.assets]
-            if asset_hosts:
-                service_count = sum(len(host.services) for host in asset_hosts)
-                options.append((f"{asset.name} ({len(asset_hosts)} hosts, {service_count} svc)", f"{asset.name}_discovered"))
+            totals = asset_totals.get(asset.asset_id)
+            if totals:
+                options.append((f"{asset.name} ({totals[0]} hosts, {totals[1]} svc)", f"{asset.name}_discovered"))
 
         for host in sorted(project.hosts, key=lambda item: (item.ip, getattr(item, "network_id", "unknown"))):
             service_list = ", ".join(f"{service.port}/{service.service_name or '?'}" for service in host.services)
-            label = f"{_host_label(host, duplicate_ips)}"
-            label += f" - {service_list}" if service_list else " - no services"
-            options.append((label, f"host-id:{host.host_id}"))
+            options.append((f"{_host_label(host, duplicate_ips)} - {service_list or 'no services'}", f"host-id:{host.host_id}"))
 
-        select.set_options(options)
+        _set_select_options(self, select, options)
 
     def _populate_tools(self) -> None:
         from netpal.utils.config_loader import ConfigLoader
@@ -1697,7 +1706,7 @@ class ToolsView(BaseNetPalView):
             label = f"{name} (Port {ports_str})" if ports_str else name
             options.append((label, name))
 
-        select.set_options(options)
+        _set_select_options(self, select, options)
 
     @on(TextAction.Pressed, "#btn-run-tool")
     def _handle_run(self, event: TextAction.Pressed) -> None:
@@ -1784,6 +1793,7 @@ class ToolsView(BaseNetPalView):
             self.app.call_from_thread(log.clear)
             tool_label = "Playwright" if playwright_only else (tool_val if tool_val != "__ALL__" else "All tools")
             self.app.call_from_thread(log.write, f"[bold yellow]Running {tool_label} on {len(hosts)} host(s)...[/]")
+            output_cb = _BatchedLogWriter(self.app, log)
 
             try:
                 from netpal.models.host import Host
@@ -1794,41 +1804,44 @@ class ToolsView(BaseNetPalView):
                 config = self.app.config
                 tool_runner = ToolOrchestrator(project.project_id, config)
 
-                def output_cb(line):
-                    self.app.call_from_thread(log.write, line.rstrip())
-
                 def _save_proj():
                     save_project_to_file(project)
 
                 def _save_find():
                     save_findings_to_file(project)
 
+                # Pick the service filter once rather than re-testing it per host.
+                if port_filter is not None:
+                    def _service_matches(service):
+                        return service.port == port_filter
+                elif service_filter:
+                    def _service_matches(service):
+                        return service_filter in (service.service_name or "").lower()
+                else:
+                    _service_matches = None
+
                 run_hosts = []
                 for host in hosts:
                     if not host.services:
                         continue
-                    matched_services = host.services
-                    if port_filter is not None:
-                        matched_services = [service for service in host.services if service.port == port_filter]
-                    elif service_filter:
-                        matched_services = [service for service in host.services if service_filter in (service.service_name or "").lower()]
+                    if _service_matches is None:
+                        run_hosts.append(host)
+                        continue
+                    matched_services = [service for service in host.services if _service_matches(service)]
                     if not matched_services:
                         continue
-                    if port_filter is not None or service_filter:
-                        proxy = Host(
-                            ip=host.ip,
-                            hostname=host.hostname,
-                            os=host.os,
-                            host_id=host.host_id,
-                            metadata=dict(host.metadata),
-                            network_id=getattr(host, "network_id", "unknown"),
-                        )
-                        proxy.services = matched_services
-                        proxy.findings = host.findings
-                        proxy.assets = host.assets
-                        run_hosts.append(proxy)
-                    else:
-                        run_hosts.append(host)
+                    proxy = Host(
+                        ip=host.ip,
+                        hostname=host.hostname,
+                        os=host.os,
+                        host_id=host.host_id,
+                        metadata=dict(host.metadata),
+                        network_id=getattr(host, "network_id", "unknown"),
+                    )
+                    proxy.services = matched_services
+                    proxy.findings = host.findings
+                    proxy.assets = host.assets
+                    run_hosts.append(proxy)
 
                 if not run_hosts:
                     filter_desc = ""
@@ -1854,10 +1867,12 @@ class ToolsView(BaseNetPalView):
                     rerun_autotools=rerun_autotools,
                     playwright_only=playwright_only,
                 )
+                output_cb.flush()
 
                 self.app.call_from_thread(log.write, "\n[bold green]Tool execution complete[/]")
                 self.app.call_from_thread(self._post_run_refresh)
             except Exception as exc:
+                output_cb.flush()
                 self.app.call_from_thread(log.write, f"[bold red]Error: {exc}[/]")
 
     def _post_run_refresh(self) -> None:
@@ -1892,39 +1907,52 @@ class HostsView(BaseNetPalView):
         self._refresh_hosts_table()
 
     def _refresh_hosts_table(self) -> None:
-        table = _reset_table(self, "hosts-table", "IP", "Network", "Hostname", "OS", "Services", "Findings", "Tools", "Asset")
+        columns = ("IP", "Network", "Hostname", "OS", "Services", "Findings", "Tools", "Asset")
         project = self.app.project
         metrics = self.query_one("#hosts-metrics", MetricStrip)
         if not project:
+            _fill_table(self, "hosts-table", columns, [])
             metrics.update("Hosts: 0 | Services: 0")
             return
+        rows: list[tuple[str, tuple]] = []
+        service_total = 0
+        duplicate_ips = _duplicate_ip_set(project)
+        findings_per_host = Counter(finding.host_id for finding in project.findings)
+        # Rank assets once; a host shows the first project asset it belongs to.
+        asset_rank: dict[int, tuple[int, str]] = {}
+        for index, asset in enumerate(project.assets):
+            asset_rank.setdefault(asset.asset_id, (index, asset.name))
+        for host in sorted(project.hosts, key=lambda item: (item.ip, getattr(item, "network_id", "unknown"))):
+            asset_name = min(
+                (asset_rank[asset_id] for asset_id in host.assets if asset_id in asset_rank),
+                default=(0, "-"),
+            )[1]
+            finding_count = findings_per_host[host.host_id]
+            tool_count = sum(len(service.proofs) for service in host.services)
+            service_total += len(host.services)
+            rows.append(
+                (
+                    str(host.host_id),
+                    (
+                        host.ip,
+                        getattr(host, "network_id", "unknown") if host.ip in duplicate_ips else "-",
+                        host.hostname or "-",
+                        host.os or "-",
+                        str(len(host.services)),
+                        str(finding_count),
+                        str(tool_count),
+                        asset_name,
+                    ),
+                )
+            )
+        _fill_table(self, "hosts-table", columns, rows)
         metrics.update(
             _format_metric_line(
                 f"Hosts: {len(project.hosts)}",
-                f"Services: {sum(len(host.services) for host in project.hosts)}",
+                f"Services: {service_total}",
                 f"Findings: {len(project.findings)}",
             )
         )
-        duplicate_ips = _duplicate_ip_set(project)
-        for host in sorted(project.hosts, key=lambda item: (item.ip, getattr(item, "network_id", "unknown"))):
-            asset_name = "-"
-            for asset in project.assets:
-                if asset.asset_id in host.assets:
-                    asset_name = asset.name
-                    break
-            finding_count = len([finding for finding in project.findings if finding.host_id == host.host_id])
-            tool_count = sum(len(service.proofs) for service in host.services)
-            table.add_row(
-                host.ip,
-                getattr(host, "network_id", "unknown") if host.ip in duplicate_ips else "-",
-                host.hostname or "-",
-                host.os or "-",
-                str(len(host.services)),
-                str(finding_count),
-                str(tool_count),
-                asset_name,
-                key=str(host.host_id),
-            )
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         if event.row_key is None or event.row_key.value is None:
@@ -1952,7 +1980,11 @@ class HostsView(BaseNetPalView):
         if host.os:
             lines.append(f"OS: {host.os}")
 
-        host_findings = [finding for finding in project.findings if finding.host_id == host.host_id]
+        # Bucket this host's findings by port once for the per-service lines.
+        findings_by_port: dict = {}
+        for finding in project.findings:
+            if finding.host_id == host.host_id:
+                findings_by_port.setdefault(finding.port, []).append(finding)
         if not host.services:
             lines.extend(["", "[dim]No open ports discovered.[/]"])
         else:
@@ -1962,7 +1994,7 @@ class HostsView(BaseNetPalView):
                 svc_ver = service.service_version or ""
                 lines.append("")
                 lines.append(f"[bold cyan]Port {service.port}/{proto}[/] - {svc_name} {svc_ver}".rstrip())
-                port_findings = [finding for finding in host_findings if finding.port == service.port]
+                port_findings = findings_by_port.get(service.port, ())
                 if port_findings:
                     for finding in port_findings:
                         severity_color = _severity_color(finding.severity)
@@ -2016,7 +2048,6 @@ class FindingsView(BaseNetPalView):
         self._refresh_findings_table()
 
     def _refresh_findings_table(self) -> None:
-        table = _reset_table(self, "findings-table", "Severity", "Name", "Host", "Port", "CWE")
         project = self.app.project
         metrics = self.query_one("#findings-metrics", MetricStrip)
         create_btn = self.query_one("#btn-create-finding", TextAction)
@@ -2027,20 +2058,31 @@ class FindingsView(BaseNetPalView):
                 f"Hosts: {len(project.hosts) if project else 0}",
             )
         )
-        if not project:
-            return
-        duplicate_ips = _duplicate_ip_set(project)
-        for finding in project.findings:
-            host = project.get_host(finding.host_id) if finding.host_id else None
-            host_ip = _host_label(host, duplicate_ips) if host else "-"
-            table.add_row(
-                finding.severity or "-",
-                (finding.name or "-")[:60],
-                host_ip,
-                str(finding.port) if finding.port else "-",
-                finding.cwe or "-",
-                key=finding.finding_id,
-            )
+        rows = []
+        if project:
+            duplicate_ips = _duplicate_ip_set(project)
+            # Label each host once; first host wins for duplicate IDs, matching
+            # Project.get_host().
+            host_labels: dict[int, str] = {}
+            for host in project.hosts:
+                if host.host_id not in host_labels:
+                    host_labels[host.host_id] = _host_label(host, duplicate_ips)
+            label_for = host_labels.get
+            for finding in project.findings:
+                host_ip = label_for(finding.host_id, "-") if finding.host_id else "-"
+                rows.append(
+                    (
+                        finding.finding_id,
+                        (
+                            finding.severity or "-",
+                            (finding.name or "-")[:60],
+                            host_ip,
+                            str(finding.port) if finding.port else "-",
+                            finding.cwe or "-",
+                        ),
+                    )
+                )
+        _fill_table(self, "findings-table", ("Severity", "Name", "Host", "Port", "CWE"), rows)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         if event.row_key is None or event.row_key.value is None:
@@ -2163,6 +2205,7 @@ class EvidenceView(BaseNetPalView):
             try:
                 from netpal.services.ai.analyzer import AIAnalyzer
                 from netpal.utils.ai_helpers import run_ai_analysis
+                from netpal.utils.display.display_utils import get_ai_provider_display_name
                 from netpal.utils.persistence.project_persistence import ProjectPersistence
 
                 ai_analyzer = AIAnalyzer(config)
@@ -2170,15 +2213,7 @@ class EvidenceView(BaseNetPalView):
                     self.app.call_from_thread(log.write, "[red]AI analyzer not configured. Check Settings.[/]")
                     return
 
-                provider_names = {
-                    "aws": "AWS Bedrock",
-                    "anthropic": "Anthropic",
-                    "openai": "OpenAI",
-                    "ollama": "Ollama",
-                    "azure": "Azure OpenAI",
-                    "gemini": "Google Gemini",
-                }
-                provider_display = provider_names.get(ai_analyzer.ai_type, ai_analyzer.ai_type.upper())
+                provider_display = get_ai_provider_display_name(ai_analyzer.ai_type)
                 self.app.call_from_thread(log.write, f"[green]AI Provider: {provider_display}[/]")
                 if hasattr(ai_analyzer, "provider") and ai_analyzer.provider:
                     model_name = getattr(ai_analyzer.provider, "model_name", None)
@@ -2217,9 +2252,12 @@ class EvidenceView(BaseNetPalView):
                     for finding in ai_findings:
                         project.add_finding(finding)
                     ProjectPersistence.save_and_sync(project, save_findings=True)
-                    self.app.call_from_thread(log.write, f"\n[bold green]Generated {len(ai_findings)} finding(s)[/]")
-                    for finding in ai_findings:
-                        self.app.call_from_thread(log.write, f"  [{_severity_color(finding.severity)}]{finding.severity}[/] - {finding.name}")
+                    summary = [f"\n[bold green]Generated {len(ai_findings)} finding(s)[/]"]
+                    summary.extend(
+                        f"  [{_severity_color(finding.severity)}]{finding.severity}[/] - {finding.name}"
+                        for finding in ai_findings
+                    )
+                    self.app.call_from_thread(_write_log_lines, log, summary)
                 else:
                     self.app.call_from_thread(log.write, "[yellow]No findings generated.[/]")
             except Exception as exc:
@@ -2275,10 +2313,15 @@ class EvidenceView(BaseNetPalView):
                     elif event_type == "finding_error":
                         self.app.call_from_thread(log.write, f"  [red]Enhancement failed: {data['error']}[/]")
                     elif event_type == "summary":
-                        self.app.call_from_thread(log.write, f"\n[bold green]All {data['total']} finding(s) enhanced successfully[/]")
-                        self.app.call_from_thread(log.write, "\n[cyan]Enhanced findings by severity:[/]")
-                        for severity, count in data["severity_counts"].items():
-                            self.app.call_from_thread(log.write, f"  [{_severity_color(severity)}]{severity}: {count}[/]")
+                        summary = [
+                            f"\n[bold green]All {data['total']} finding(s) enhanced successfully[/]",
+                            "\n[cyan]Enhanced findings by severity:[/]",
+                        ]
+                        summary.extend(
+                            f"  [{_severity_color(severity)}]{severity}: {count}[/]"
+                            for severity, count in data["severity_counts"].items()
+                        )
+                        self.app.call_from_thread(_write_log_lines, log, summary)
 
                 run_ai_enhancement(ai_analyzer, project, progress_callback=_tui_enhance_progress)
                 ProjectPersistence.save_and_sync(project, save_findings=True)
@@ -3205,6 +3248,7 @@ class NetPalApp(App):
         super().__init__()
         self.config: dict = _load_config()
         self._current_view: str = VIEW_PROJECTS
+        self._project_watch_count = 0
 
     def compose(self) -> ComposeResult:
         yield Static("", id="active-context")
@@ -3268,6 +3312,7 @@ class NetPalApp(App):
         self._update_nav_labels()
 
     def watch_project(self, old_value, new_value) -> None:
+        self._project_watch_count += 1
         self._update_nav_state()
         self._update_context_bar()
         self._refresh_active_view(self._current_view)
@@ -3275,7 +3320,11 @@ class NetPalApp(App):
     def refresh_project_state(self, project=_PROJECT_STATE_UNSET) -> None:
         """Refresh navigation and active view after in-place project mutations."""
         if project is not _PROJECT_STATE_UNSET:
+            watch_count = self._project_watch_count
             self.project = project
+            if self._project_watch_count != watch_count:
+                # watch_project already refreshed everything for the new value.
+                return
         self._update_nav_state()
         self._update_context_bar()
         self._refresh_active_view(self._current_view)
@@ -3362,25 +3411,11 @@ class NetPalApp(App):
         self._refresh_active_view(view_id)
 
     def _refresh_active_view(self, view_id: str) -> None:
-        view_map = {
-            VIEW_PROJECTS: ProjectsView,
-            VIEW_ASSETS: AssetsView,
-            VIEW_RECON: ReconView,
-            VIEW_TOOLS: ToolsView,
-            VIEW_HOSTS: HostsView,
-            VIEW_FINDINGS: FindingsView,
-            VIEW_EVIDENCE: EvidenceView,
-            VIEW_AD_SCAN: ADScanView,
-            VIEW_TESTCASES: TestCasesView,
-            VIEW_CREDENTIALS: CredentialsView,
-            VIEW_SETTINGS: SettingsView,
-        }
-        cls = view_map.get(view_id)
-        if cls:
-            try:
-                self.query_one(cls).refresh_view()
-            except Exception:
-                pass
+        # Views are composed with their view ID as widget ID.
+        try:
+            self.query_one(f"#{view_id}").refresh_view()
+        except Exception:
+            pass
 
     @on(TextAction.Pressed, ".nav-button")
     def _handle_nav_button(self, event: TextAction.Pressed) -> None:
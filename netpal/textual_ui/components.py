@@ -70,6 +70,12 @@ class BaseNetPalView(VerticalScroll):
 
     DEFAULT_CLASSES = "base-netpal-view"
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Content last filled into child tables and selects, keyed by widget
+        # id, so a refresh with unchanged data can leave the widget alone.
+        self._filled_snapshots: dict[str, object] = {}
+
     def refresh_view(self) -> None:
         """Refresh widget content when the app state changes."""
 
@@ -152,6 +158,16 @@ class MetricStrip(Static):
 
     DEFAULT_CLASSES = "metric-strip"
 
+    _metric_text: str | None = None
+
+    def update(self, content="", *, layout: bool = True) -> None:
+        # Views refresh their metrics on every table rebuild; skip the
+        # re-render and layout pass when the text has not changed.
+        if isinstance(content, str) and content == self._metric_text:
+            return
+        self._metric_text = content if isinstance(content, str) else None
+        super().update(content, layout=layout)
+
 
 class StatusLine(Static):
     """Hide empty status rows so dialogs don't reserve dead space."""
@@ -197,7 +213,13 @@ class DenseFormGrid(Vertical):
 
 
 class LogPanel(Vertical):
-    """Shared log panel wrapper with a titled RichLog."""
+    """Shared log panel wrapper with a titled RichLog.
+
+    Verbose scans can emit tens of thousands of lines; the log keeps the
+    newest ``MAX_LINES`` so each write does not grow the widget further.
+    """
+
+    MAX_LINES = 5000
 
     def __init__(self, title: str, log_id: str, *, id: str | None = None) -> None:
         super().__init__(id=id, classes="pane-box")
@@ -206,4 +228,4 @@ class LogPanel(Vertical):
 
     def compose(self) -> ComposeResult:
         yield Static(self._title, classes="panel-title")
-        yield RichLog(id=self._log_id, highlight=True, markup=True, min_width=0, wrap=True)
+        yield RichLog(id=self._log_id, highlight=True, markup=True, min_width=0, wrap=True, max_lines=self.MAX_LINES)
@@ -5,6 +5,8 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
+import time
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -98,34 +100,31 @@ def _prepare_starter_asset(asset_type, asset_target: str):
     return prepare_starter_asset(asset_type, asset_target)
 
 
+_SEVERITY_COLORS = {
+    "Critical": "bold red",
+    "High": "red",
+    "Medium": "yellow",
+    "Low": "cyan",
+    "Info": "dim",
+}
+
+
 def _severity_color(severity: str) -> str:
-    return {
-        "Critical": "bold red",
-        "High": "red",
-        "Medium": "yellow",
-        "Low": "cyan",
-        "Info": "dim",
-    }.get(severity, "white")
+    return _SEVERITY_COLORS.get(severity, "white")
 
 
-def _duplicate_ip_set(project) -> set[str]:
+def _duplicate_ip_set(project) -> frozenset[str]:
     """Return the set of IPs that appear more than once in a project."""
     if not project:
-        return set()
-    seen: dict[str, int] = {}
-    for host in project.hosts:
-        seen[host.ip] = seen.get(host.ip, 0) + 1
-    return {ip for ip, count in seen.items() if count > 1}
+        return frozenset()
+    return project.get_duplicate_ips()
 
 
-def _host_label(host, duplicate_ips: set[str] | None = None) -> str:
+def _host_label(host, duplicate_ips: frozenset[str] | None = None) -> str:
     """Return a stable human-readable host label."""
-    duplicate_ips = duplicate_ips or set()
-    label = host.ip
-    if host.hostname:
-        label += f" ({host.hostname})"
-    if host.ip in duplicate_ips:
-        label += f" [{getattr(host, 'network_id', 'unknown')}]"
+    label = f"{host.ip} ({host.hostname})" if host.hostname else host.ip
+    if duplicate_ips and host.ip in duplicate_ips:
+        return f"{label} [{getattr(host, 'network_id', 'unknown')}]"
     return label
 
 
@@ -244,6 +243,99 @@ def _reset_table(container, table_id: str, *columns: str) -> DataTable:
     return table
 
 
+def _fill_table(view, table_id: str, columns: tuple[str, ...], rows: list[tuple[str, tuple]]) -> DataTable:
+    """Populate a view's DataTable with ``(key, cells)`` rows.
+
+    Views refresh on every project reload; when the table already shows
+    exactly these rows the clear/re-add (and cursor reset) is skipped.
+    """
+    snapshot = (columns, rows)
+    if view._filled_snapshots.get(table_id) == snapshot:
+        return view.query_one(f"#{table_id}", DataTable)
+    table = _reset_table(view, table_id, *columns)
+    for key, cells in rows:
+        table.add_row(*cells, key=key)
+    view._filled_snapshots[table_id] = snapshot
+    return table
+
+
+def _set_select_options(view, select: Select, options: list[tuple[str, str]]) -> None:
+    """Set *options* on a view's *select* unless it already shows exactly these.
+
+    Views repopulate their selects on every project reload; skipping the
+    identical case avoids rebuilding the dropdown and keeps the selection.
+    """
+    if view._filled_snapshots.get(select.id) == options:
+        return
+    select.set_options(options)
+    view._filled_snapshots[select.id] = options
+
+
+def _write_log_lines(log, lines) -> None:
+    """Write *lines* to a RichLog one entry each, from the UI thread.
+
+    Workers pass this to ``call_from_thread`` so a block of lines costs one
+    thread hop instead of one per line; per-line writes keep markup scoped
+    exactly as individual writes would.
+    """
+    for line in lines:
+        log.write(line)
+
+
+class _BatchedLogWriter:
+    """Output callback that forwards worker-thread lines to a RichLog in batches.
+
+    ``call_from_thread`` blocks the worker until the UI has run the write, so
+    one call per nmap/tool output line throttles noisy scans. Lines are
+    buffered and written in a single UI call at most every *interval*
+    seconds; a one-shot timer writes out a quiet tail so nothing waits for
+    the next line. Call :meth:`flush` before writing to the log directly so
+    the output stays in order.
+    """
+
+    def __init__(self, app, log, interval: float = 0.1) -> None:
+        self._app = app
+        self._log = log
+        self._interval = interval
+        self._pending: list[str] = []
+        self._last_flush = time.monotonic()
+        self._timer: threading.Timer | None = None
+        # Tool runs report from a thread pool.
+        self._lock = threading.Lock()
+
+    def __call__(self, line: str) -> None:
+        with self._lock:
+            self._pending.append(line.rstrip())
+            wait = self._interval - (time.monotonic() - self._last_flush)
+            if wait > 0:
+                if self._timer is None:
+                    self._timer = threading.Timer(wait, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+            self._deliver()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._deliver()
+
+    def _deliver(self) -> None:
+        # Called with the lock held, so a timer flush and a worker flush
+        # cannot hand their batches to the UI out of order. The UI thread
+        # never takes this lock, so waiting on it here cannot deadlock.
+        batch = self._take()
+        if batch:
+            self._app.call_from_thread(_write_log_lines, self._log, batch)
+
+    def _take(self) -> list[str]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        self._last_flush = time.monotonic()
+        return batch
+
+
 VIEW_PROJECTS = "view-projects"
 VIEW_ASSETS = "view-assets"
 VIEW_RECON = "view-recon"
@@ -8,6 +8,14 @@ import shutil
 import time
 from typing import Any
 
+from netpal.models.asset import Asset
+from netpal.utils.naming_utils import sanitize_for_filename
+from netpal.utils.network_utils import validate_cidr
+from netpal.utils.persistence.file_utils import ensure_dir
+from netpal.utils.persistence.project_paths import get_base_scan_results_dir
+from netpal.utils.persistence.project_persistence import save_project_to_file
+from netpal.utils.validation import validate_target
+
 
 class AssetFactory:
     """Factory for creating different types of assets.
@@ -37,19 +45,15 @@ class AssetFactory:
         Returns:
             Relative path (from scan_results/) to the created file.
         """
-        from netpal.utils.persistence.file_utils import ensure_dir
-        from netpal.utils.persistence.project_paths import get_base_scan_results_dir
-        from netpal.utils.naming_utils import sanitize_for_filename
-
         base_dir = get_base_scan_results_dir()
         safe_name = sanitize_for_filename(name)
         targets_dir = os.path.join(base_dir, project_id)
         ensure_dir(targets_dir)
 
         filepath = os.path.join(targets_dir, f"{safe_name}_targets.txt")
-        hosts = [h.strip() for h in targets_csv.split(',') if h.strip()]
+        hosts = (h.strip() for h in targets_csv.split(','))
         with open(filepath, 'w') as fh:
-            fh.write('\n'.join(hosts) + '\n')
+            fh.writelines(f"{host}\n" for host in hosts if host)
 
         # Return path relative to scan_results/ for portability
         return os.path.relpath(filepath, base_dir)
@@ -72,9 +76,6 @@ class AssetFactory:
         Raises:
             FileNotFoundError: If *source_path* does not exist.
         """
-        from netpal.utils.persistence.file_utils import ensure_dir
-        from netpal.utils.persistence.project_paths import get_base_scan_results_dir
-
         source_path = os.path.expanduser(source_path)
         if not os.path.isabs(source_path):
             source_path = os.path.abspath(source_path)
@@ -128,10 +129,7 @@ class AssetFactory:
             >>> asset.type
             'network'
         """
-        from netpal.models.asset import Asset
-        
         if asset_type == 'network':
-            from netpal.utils.network_utils import validate_cidr
             is_valid, error_msg = validate_cidr(target_data)
             if not is_valid:
                 raise ValueError(f"Invalid CIDR range: {error_msg}")
@@ -177,7 +175,6 @@ class AssetFactory:
                     description=description,
                 )
         elif asset_type == 'single':
-            from netpal.utils.validation import validate_target
             is_valid, target_type, error_msg = validate_target(target_data)
             if not is_valid:
                 raise ValueError(f"Invalid target: {error_msg}")
@@ -278,8 +275,6 @@ def create_asset_headless(project, asset_type, name, target_data, description: s
     Raises:
         ValueError: If inputs are invalid (bad CIDR, missing data, etc.).
     """
-    from netpal.utils.persistence.project_persistence import save_project_to_file
-
     asset_id = len(project.assets)
     asset = AssetFactory.create_asset(
         str(asset_type), name, asset_id, target_data,
@@ -306,8 +301,6 @@ def delete_asset_headless(project, asset_name):
     Raises:
         ValueError: If no asset with *asset_name* exists.
     """
-    from netpal.utils.persistence.project_persistence import save_project_to_file
-
     asset = None
     for a in project.assets:
         if a.name == asset_name:
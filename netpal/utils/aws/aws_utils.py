@@ -1,4 +1,5 @@
 """AWS utilities for session management used by Bedrock."""
+import functools
 import os
 import subprocess
 import pwd
@@ -6,8 +7,9 @@ from typing import Optional
 from colorama import Fore, Style
 
 
+@functools.cache
 def _import_boto3():
-    """Lazily import boto3, raising a helpful error if not installed."""
+    """Lazily import boto3 once, raising a helpful error if not installed."""
     try:
         import boto3
         return boto3
@@ -2,9 +2,11 @@
 Configuration loader for JSON files
 """
 import os
+import copy
 import json
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from colorama import Fore, Style
 
 
@@ -45,6 +47,48 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 
 DEFAULT_AUTO_TOOL_CREDENTIALS: List[Dict[str, Any]] = []
 
+# Parsed JSON config files keyed by absolute path.  Each entry stores the
+# file's (mtime_ns, size, inode) at parse time so edits on disk, including
+# atomic replace-on-save, invalidate it.
+_JSON_CACHE: "OrderedDict[str, Tuple[Tuple[int, int, int], Any]]" = OrderedDict()
+_JSON_CACHE_MAX = 100
+
+
+def _load_json_cached(path: str) -> Any:
+    """Load a JSON file, reusing the parsed result while it is unchanged.
+
+    Callers receive a deep copy so mutating the returned data never leaks
+    into later loads.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read
+        json.JSONDecodeError: If the file contains invalid JSON
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    cached = _JSON_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        _JSON_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[1])
+
+    with open(key, 'r') as f:
+        data = json.load(f)
+
+    _JSON_CACHE[key] = (signature, data)
+    _JSON_CACHE.move_to_end(key)
+    while len(_JSON_CACHE) > _JSON_CACHE_MAX:
+        _JSON_CACHE.popitem(last=False)
+
+    return copy.deepcopy(data)
+
 
 class ConfigLoader:
     """Handles loading and saving configuration files."""
@@ -144,8 +188,7 @@ class ConfigLoader:
         config_path = ConfigLoader.ensure_config_exists()
         
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            return _load_json_cached(config_path)
         except Exception as e:
             print(f"Error loading config.json: {e}")
         
@@ -163,11 +206,9 @@ class ConfigLoader:
         tools_path = ConfigLoader.get_config_path("exploit_tools.json")
         
         try:
-            import json
             if os.path.exists(tools_path):
-                with open(tools_path, 'r') as f:
-                    data = json.load(f)
-                    return data if isinstance(data, list) else data.get("tools", [])
+                data = _load_json_cached(tools_path)
+                return data if isinstance(data, list) else data.get("tools", [])
         except Exception as e:
             print(f"Error loading exploit_tools.json: {e}")
         
@@ -205,9 +246,8 @@ class ConfigLoader:
 
         try:
             if os.path.exists(recon_path):
-                with open(recon_path, "r") as f:
-                    data = json.load(f)
-                    return data if isinstance(data, list) else []
+                data = _load_json_cached(recon_path)
+                return data if isinstance(data, list) else []
         except Exception as e:
             print(f"Error loading recon_types.json: {e}")
 
@@ -251,10 +291,8 @@ class ConfigLoader:
         prompts_path = ConfigLoader.get_config_path("ai_prompts.json")
         
         try:
-            import json
             if os.path.exists(prompts_path):
-                with open(prompts_path, 'r') as f:
-                    return json.load(f)
+                return _load_json_cached(prompts_path)
         except Exception as e:
             print(f"Error loading ai_prompts.json: {e}")
         
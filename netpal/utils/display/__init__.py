@@ -6,6 +6,7 @@ from .display_utils import (
     print_banner,
     print_tool_status,
     display_ai_provider_info,
+    get_ai_provider_display_name,
     print_next_command_box,
     display_hosts_detail,
 )
@@ -16,6 +17,7 @@ __all__ = [
     'print_banner',
     'print_tool_status',
     'display_ai_provider_info',
+    'get_ai_provider_display_name',
     'print_next_command_box',
     'display_hosts_detail',
     'display_findings_summary',
@@ -1,6 +1,8 @@
 """
 Display and UI utilities for NetPal
 """
+from collections import Counter
+
 from colorama import Fore, Style
 
 INDENT = "  "
@@ -11,6 +13,15 @@ COLOR_EMPHASIS = Fore.CYAN
 COLOR_WARNING = Fore.YELLOW
 COLOR_ERROR = Fore.RED
 
+AI_PROVIDER_DISPLAY_NAMES = {
+    'aws': 'AWS Bedrock',
+    'anthropic': 'Anthropic',
+    'openai': 'OpenAI',
+    'ollama': 'Ollama',
+    'azure': 'Azure OpenAI',
+    'gemini': 'Google Gemini',
+}
+
 
 def print_banner():
     """Display NetPal banner."""
@@ -59,6 +70,11 @@ def print_tool_status(tool_name, is_required, is_installed):
     print(f"{req_label}{status} {tool_name}")
 
 
+def get_ai_provider_display_name(ai_type):
+    """Return the human-readable name for an ``ai_type`` config value."""
+    return AI_PROVIDER_DISPLAY_NAMES.get(ai_type, (ai_type or '').upper())
+
+
 def display_ai_provider_info(ai_analyzer):
     """Display AI provider information.
     
@@ -70,18 +86,7 @@ def display_ai_provider_info(ai_analyzer):
         [INFO] Using AI Provider: aws (Claude via AWS Bedrock)
         [INFO] Model: us.anthropic.claude-sonnet-4-5-20250929-v1:0
     """
-    ai_type = ai_analyzer.ai_type
-    
-    provider_names = {
-        'aws': 'AWS Bedrock',
-        'anthropic': 'Anthropic',
-        'openai': 'OpenAI',
-        'ollama': 'Ollama',
-        'azure': 'Azure OpenAI',
-        'gemini': 'Google Gemini'
-    }
-    
-    provider_display = provider_names.get(ai_type, ai_type.upper())
+    provider_display = get_ai_provider_display_name(ai_analyzer.ai_type)
     print(f"{Fore.GREEN}[INFO] Using AI Provider: {provider_display}{Style.RESET_ALL}")
     
     # Display model if available
@@ -194,7 +199,8 @@ def display_hosts_detail(hosts):
 
     width = 72
 
-    duplicate_ips = {host.ip for host in hosts if sum(1 for h in hosts if h.ip == host.ip) > 1}
+    ip_counts = Counter(host.ip for host in hosts)
+    duplicate_ips = {ip for ip, count in ip_counts.items() if count > 1}
 
     for host in sorted(hosts, key=lambda h: (h.ip, getattr(h, "network_id", "unknown"))):
         hostname_part = f"  {Fore.LIGHTBLACK_EX}({host.hostname}){Style.RESET_ALL}" if host.hostname else ""
@@ -206,22 +212,23 @@ def display_hosts_detail(hosts):
                 f"{getattr(host, 'network_id', 'unknown')}{Style.RESET_ALL}"
             )
 
-        print(f"{Fore.CYAN}╭{'─' * width}╮{Style.RESET_ALL}")
-        print(
+        # Each card is printed as one block rather than a write per line.
+        lines = [f"{Fore.CYAN}╭{'─' * width}╮{Style.RESET_ALL}"]
+        lines.append(
             f"{Fore.CYAN}│{Style.RESET_ALL}  "
             f"{Fore.WHITE}{host.ip}{Style.RESET_ALL}"
             f"{hostname_part}{os_part}{network_part}"
         )
         finding_count = len(host.findings)
         if finding_count:
-            print(
+            lines.append(
                 f"{Fore.CYAN}│{Style.RESET_ALL}  "
                 f"{Fore.YELLOW}{finding_count} finding(s){Style.RESET_ALL}"
             )
-        print(f"{Fore.CYAN}├{'─' * width}┤{Style.RESET_ALL}")
+        lines.append(f"{Fore.CYAN}├{'─' * width}┤{Style.RESET_ALL}")
 
         if not host.services:
-            print(
+            lines.append(
                 f"{Fore.CYAN}│{Style.RESET_ALL}  "
                 f"{Fore.LIGHTBLACK_EX}No open ports detected{Style.RESET_ALL}"
             )
@@ -229,7 +236,7 @@ def display_hosts_detail(hosts):
             for i, svc in enumerate(sorted(host.services, key=lambda s: s.port)):
                 ver = f" {svc.service_version}" if svc.service_version else ""
                 extra = f" ({svc.extrainfo})" if svc.extrainfo else ""
-                print(
+                lines.append(
                     f"{Fore.CYAN}│{Style.RESET_ALL}  "
                     f"{Fore.GREEN}{svc.port}/{svc.protocol}{Style.RESET_ALL}  "
                     f"{Fore.WHITE}{svc.service_name}{Style.RESET_ALL}"
@@ -245,27 +252,28 @@ def display_hosts_detail(hosts):
                         if result_file:
                             abs_path = resolve_scan_results_path(result_file)
                             label = _proof_label(ptype)
-                            print(
+                            lines.append(
                                 f"{Fore.CYAN}│{Style.RESET_ALL}      "
                                 f"{Fore.LIGHTBLACK_EX}{label}:{Style.RESET_ALL} "
                                 f"{Fore.LIGHTBLACK_EX}{abs_path}{Style.RESET_ALL}"
                             )
                         if screenshot:
                             abs_ss = resolve_scan_results_path(screenshot)
-                            print(
+                            lines.append(
                                 f"{Fore.CYAN}│{Style.RESET_ALL}      "
                                 f"{Fore.LIGHTBLACK_EX}screenshot:{Style.RESET_ALL} "
                                 f"{Fore.LIGHTBLACK_EX}{abs_ss}{Style.RESET_ALL}"
                             )
                 else:
-                    print(
+                    lines.append(
                         f"{Fore.CYAN}│{Style.RESET_ALL}      "
                         f"{Fore.LIGHTBLACK_EX}(no evidence){Style.RESET_ALL}"
                     )
 
                 if i < len(host.services) - 1:
-                    print(f"{Fore.CYAN}│{Style.RESET_ALL}")
+                    lines.append(f"{Fore.CYAN}│{Style.RESET_ALL}")
 
-        print(f"{Fore.CYAN}╰{'─' * width}╯{Style.RESET_ALL}\n")
+        lines.append(f"{Fore.CYAN}╰{'─' * width}╯{Style.RESET_ALL}\n")
+        print("\n".join(lines))
 
     return True
@@ -25,17 +25,21 @@ def _wrap_text(text, width=80, indent="    "):
                                    subsequent_indent=indent))
 
 
-def _resolve_host_info(finding, hosts):
-    """Resolve host IP and port string for a finding."""
-    if finding.host_id is None or not hosts:
+def _resolve_host_info(finding, host_ips):
+    """Resolve host IP and port string for a finding.
+
+    Args:
+        finding: Finding object
+        host_ips: Mapping of host_id to IP address
+    """
+    if finding.host_id is None:
         return ""
-    for host in hosts:
-        if host.host_id == finding.host_id:
-            info = host.ip
-            if finding.port:
-                info += f":{finding.port}"
-            return info
-    return ""
+    info = host_ips.get(finding.host_id)
+    if info is None:
+        return ""
+    if finding.port:
+        info += f":{finding.port}"
+    return info
 
 
 def display_findings_summary(findings, hosts_with_services=None):
@@ -52,22 +56,27 @@ def display_findings_summary(findings, hosts_with_services=None):
 
     print(f"\n{Fore.GREEN}[SUCCESS] {len(findings)} finding(s){Style.RESET_ALL}")
 
-    # Severity counts
-    severity_counts = {}
+    # Group by severity in one pass; counts come from the group sizes
+    findings_by_severity = {}
     for finding in findings:
-        severity_counts[finding.severity] = severity_counts.get(finding.severity, 0) + 1
+        findings_by_severity.setdefault(finding.severity, []).append(finding)
+
+    # First host wins for duplicate IDs, matching the previous linear lookup
+    host_ips = {}
+    for host in hosts_with_services or []:
+        host_ips.setdefault(host.host_id, host.ip)
 
     print(f"\n{Fore.CYAN}Findings by severity:{Style.RESET_ALL}")
     for severity in Severity.ordered():
-        if severity in severity_counts:
+        if severity in findings_by_severity:
             color = SEVERITY_COLORS.get(severity, Fore.WHITE)
-            print(f"  {color}{severity}: {severity_counts[severity]}{Style.RESET_ALL}")
+            print(f"  {color}{severity}: {len(findings_by_severity[severity])}{Style.RESET_ALL}")
 
     # Detailed findings grouped by severity
     print(f"\n{'─' * 80}")
 
     for severity in Severity.ordered():
-        severity_findings = [f for f in findings if f.severity == severity]
+        severity_findings = findings_by_severity.get(severity)
         if not severity_findings:
             continue
 
@@ -77,7 +86,7 @@ def display_findings_summary(findings, hosts_with_services=None):
         print(f"{'━' * 80}{Style.RESET_ALL}")
 
         for finding in severity_findings:
-            host_info = _resolve_host_info(finding, hosts_with_services)
+            host_info = _resolve_host_info(finding, host_ips)
 
             # Finding header
             print(f"\n  {color}■ {finding.name}{Style.RESET_ALL}")
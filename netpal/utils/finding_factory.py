@@ -1,8 +1,8 @@
 """Shared manual finding creation helpers."""
 
-from netpal.models.finding import Finding
+from netpal.models.finding import Finding, SEVERITY_LEVELS
 
-VALID_SEVERITIES = {"Critical", "High", "Medium", "Low", "Info"}
+VALID_SEVERITIES = frozenset(SEVERITY_LEVELS)
 
 
 def create_finding_headless(
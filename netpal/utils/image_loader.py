@@ -4,10 +4,69 @@ This module provides utilities for loading and formatting images for different
 AI providers, eliminating 90+ duplicate lines across ai_analyzer.py.
 """
 import base64
+import os
+import threading
+from collections import OrderedDict
 from typing import List, Dict
 from pathlib import Path
 
 
+_MEDIA_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp'
+}
+
+# Loaded screenshots keyed by (path, mtime_ns, size, encoding). Re-running
+# an AI review or enhancement sends the same screenshots again, so the
+# payload (base64 text or raw bytes) is reused until the file changes.
+# Bounded to keep memory flat.
+_IMAGE_CACHE_MAX = 32
+_IMAGE_CACHE: "OrderedDict[tuple, str | bytes]" = OrderedDict()
+_IMAGE_CACHE_LOCK = threading.Lock()
+
+
+def _load_image(img_path: str, encoding: str = 'base64') -> "str | bytes":
+    """Return *img_path* as base64 text or raw bytes, reusing a cached copy."""
+    stat = os.stat(img_path)
+    key = (img_path, stat.st_mtime_ns, stat.st_size, encoding)
+    with _IMAGE_CACHE_LOCK:
+        cached = _IMAGE_CACHE.get(key)
+        if cached is not None:
+            _IMAGE_CACHE.move_to_end(key)
+            return cached
+    with open(img_path, 'rb') as f:
+        data = f.read()
+    if encoding == 'base64':
+        data = base64.b64encode(data).decode('utf-8')
+    with _IMAGE_CACHE_LOCK:
+        _IMAGE_CACHE[key] = data
+        if len(_IMAGE_CACHE) > _IMAGE_CACHE_MAX:
+            _IMAGE_CACHE.popitem(last=False)
+    return data
+
+
+def _load_images(image_paths: List[str], max_images: int, encoding: str) -> List[Dict]:
+    """Load up to *max_images* images in input order, skipping unreadable ones."""
+    images = []
+    
+    for img_path in image_paths[:max_images]:
+        try:
+            images.append({
+                'path': img_path,
+                'data': _load_image(img_path, encoding),
+                'encoding': encoding,
+                'media_type': _get_media_type(img_path)
+            })
+        except Exception:
+            # Skip images that can't be loaded
+            pass
+    
+    return images
+
+
 def load_images_as_base64(
     image_paths: List[str],
     max_images: int = 5
@@ -34,25 +93,27 @@ def load_images_as_base64(
         >>> images[0]['media_type']
         'image/png'
     """
-    images = []
+    return _load_images(image_paths, max_images, 'base64')
+
+
+def load_images_as_bytes(
+    image_paths: List[str],
+    max_images: int = 5
+) -> List[Dict]:
+    """Load images as raw bytes for providers that take binary parts.
     
-    for img_path in image_paths[:max_images]:
-        try:
-            with open(img_path, 'rb') as f:
-                img_bytes = f.read()
-                img_b64 = base64.b64encode(img_bytes).decode('utf-8')
-                
-                images.append({
-                    'path': img_path,
-                    'data': img_b64,
-                    'encoding': 'base64',
-                    'media_type': _get_media_type(img_path)
-                })
-        except Exception:
-            # Skip images that can't be loaded
-            pass
+    Same shape as :func:`load_images_as_base64` but with ``'encoding':
+    'raw'`` and the file bytes in ``'data'``, so callers that would only
+    decode the base64 again skip the round-trip.
     
-    return images
+    Args:
+        image_paths: List of image file paths
+        max_images: Maximum images to load (default: 5)
+        
+    Returns:
+        List of dicts with 'path', 'data', 'encoding', 'media_type'
+    """
+    return _load_images(image_paths, max_images, 'raw')
 
 
 def _get_media_type(filepath: str) -> str:
@@ -65,16 +126,7 @@ def _get_media_type(filepath: str) -> str:
         Media type string (default: 'image/png')
     """
     ext = Path(filepath).suffix.lower()
-    
-    media_types = {
-        '.png': 'image/png',
-        '.jpg': 'image/jpeg',
-        '.jpeg': 'image/jpeg',
-        '.gif': 'image/gif',
-        '.webp': 'image/webp'
-    }
-    
-    return media_types.get(ext, 'image/png')
+    return _MEDIA_TYPES.get(ext, 'image/png')
 
 
 class ImageFormatter:
@@ -166,7 +218,10 @@ class ImageFormatter:
             
             parts = []
             for img in images:
-                img_bytes = base64.b64decode(img['data'])
+                if img.get('encoding') == 'raw':
+                    img_bytes = img['data']
+                else:
+                    img_bytes = base64.b64decode(img['data'])
                 parts.append(types.Part.from_bytes(
                     data=img_bytes,
                     mime_type=img['media_type']
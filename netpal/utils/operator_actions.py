@@ -6,6 +6,7 @@ import contextlib
 import json
 import logging
 import os
+import tempfile
 import traceback
 from pathlib import Path
 from typing import Callable
@@ -105,6 +106,7 @@ SCAN_TYPES = [
 ]
 
 AUTO_TOOL_CREDENTIAL_TYPE_OPTIONS = [("All", "all"), ("Domain", "domain"), ("Web", "web")]
+CREDENTIAL_TYPE_LABELS = {value: label for label, value in AUTO_TOOL_CREDENTIAL_TYPE_OPTIONS}
 
 
 def boolish(value) -> bool:
@@ -124,11 +126,7 @@ def normalize_credential_type(value: str) -> str:
 
 def credential_type_label(value: str) -> str:
     """Return a display label for a credential type."""
-    return {
-        "all": "All",
-        "domain": "Domain",
-        "web": "Web",
-    }.get(normalize_credential_type(value), "All")
+    return CREDENTIAL_TYPE_LABELS[normalize_credential_type(value)]
 
 
 def load_config() -> dict:
@@ -136,13 +134,45 @@ def load_config() -> dict:
     return ConfigLoader.load_config_json()
 
 
+def _write_settings_file(path: Path, data) -> None:
+    """Write a JSON settings file atomically, skipping unchanged content."""
+    text = json.dumps(data, indent=2)
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return
+        existing = path.stat()
+    except OSError:
+        existing = None
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # mkstemp creates a fresh 0600 file with O_EXCL, so a stale or planted
+    # temp file is never reused; the final mode is set before any content
+    # lands in it, so credentials never sit on disk with a looser mode.
+    if existing is not None:
+        mode = existing.st_mode & 0o7777
+    else:
+        mode = 0o600 if path.name == "creds.json" else 0o644
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            os.fchmod(fd, mode)
+            if existing is not None:
+                # Keep the original owner too (e.g. creds.json edited under sudo).
+                with contextlib.suppress(OSError):
+                    os.fchown(fd, existing.st_uid, existing.st_gid)
+            handle.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
 def save_config(config_dict: dict) -> bool:
     """Persist config.json."""
     config_path = Path(ConfigLoader.get_config_path("config.json"))
     try:
-        config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, "w", encoding="utf-8") as handle:
-            json.dump(config_dict, handle, indent=2)
+        _write_settings_file(config_path, config_dict)
         return True
     except Exception:
         logging.getLogger(__name__).exception("Failed to save config.json")
@@ -169,9 +199,7 @@ def save_settings_document(filename: str, data) -> bool:
 
     config_path = Path(ConfigLoader.get_config_path(filename))
     try:
-        config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, "w", encoding="utf-8") as handle:
-            json.dump(data, handle, indent=2)
+        _write_settings_file(config_path, data)
         return True
     except Exception:
         logging.getLogger(__name__).exception("Failed to save %s", filename)
@@ -271,20 +299,26 @@ def get_path_suggestions(value: str, limit: int = 10) -> list[str]:
         if not parent or not parent.is_dir():
             return []
 
+        # Called on every keystroke in the path inputs: filter directory
+        # entries by prefix before sorting and use scandir's cached type
+        # info instead of a stat per candidate.
+        prefix_lower = prefix.lower()
+        with os.scandir(parent) as entries:
+            matches = {
+                entry.name: entry
+                for entry in entries
+                if not entry.name.startswith(".")
+                and (not prefix_lower or entry.name.lower().startswith(prefix_lower))
+            }
+
         suggestions: list[str] = []
-        for child in sorted(parent.iterdir()):
-            if child.name.startswith("."):
-                continue
-            if prefix and not child.name.lower().startswith(prefix.lower()):
-                continue
-            rendered = str(child)
-            if child.is_dir() and not rendered.endswith(os.sep):
+        for name in sorted(matches)[:limit]:
+            rendered = str(parent / name)
+            if matches[name].is_dir() and not rendered.endswith(os.sep):
                 rendered += os.sep
             suggestions.append(rendered)
-            if len(suggestions) >= limit:
-                break
         return suggestions
-    except PermissionError:
+    except OSError:
         return []
 
 
@@ -919,12 +953,14 @@ def run_recon(
             if error:
                 callback(f"Error: {error}")
             elif hosts:
+                hosts_with_services = []
                 for host in hosts:
                     project.add_host(host, asset.asset_id)
+                    if host.services:
+                        hosts_with_services.append(host)
                 _save_proj()
                 callback(f"Scan complete - {len(hosts)} host(s) found")
 
-                hosts_with_services = [host for host in hosts if host.services]
                 if run_tools and hosts_with_services and not ConfigLoader.is_discovery_scan(str(scan_type)):
                     callback("Running exploit tools on discovered services...")
                     exploit_tools = ConfigLoader.load_exploit_tools()
@@ -1044,34 +1080,38 @@ def run_tools(
         def _save_find():
             save_findings_to_file(project)
 
+        # Pick the service filter once rather than re-testing it per host.
+        if port_filter is not None:
+            def _service_matches(service):
+                return service.port == port_filter
+        elif service_filter:
+            def _service_matches(service):
+                return service_filter in (service.service_name or "").lower()
+        else:
+            _service_matches = None
+
         run_hosts = []
         for host in hosts:
             if not host.services:
                 continue
-            matched_services = host.services
-            if port_filter is not None:
-                matched_services = [service for service in host.services if service.port == port_filter]
-            elif service_filter:
-                matched_services = [
-                    service for service in host.services if service_filter in (service.service_name or "").lower()
-                ]
+            if _service_matches is None:
+                run_hosts.append(host)
+                continue
+            matched_services = [service for service in host.services if _service_matches(service)]
             if not matched_services:
                 continue
-            if port_filter is not None or service_filter:
-                proxy = Host(
-                    ip=host.ip,
-                    hostname=host.hostname,
-                    os=host.os,
-                    host_id=host.host_id,
-                    metadata=dict(host.metadata),
-                    network_id=getattr(host, "network_id", "unknown"),
-                )
-                proxy.services = matched_services
-                proxy.findings = host.findings
-                proxy.assets = host.assets
-                run_hosts.append(proxy)
-            else:
-                run_hosts.append(host)
+            proxy = Host(
+                ip=host.ip,
+                hostname=host.hostname,
+                os=host.os,
+                host_id=host.host_id,
+                metadata=dict(host.metadata),
+                network_id=getattr(host, "network_id", "unknown"),
+            )
+            proxy.services = matched_services
+            proxy.findings = host.findings
+            proxy.assets = host.assets
+            run_hosts.append(proxy)
 
         if not run_hosts:
             raise ValueError("No hosts with matching services for the selected filter.")
@@ -1110,6 +1150,7 @@ def run_ai_review(
     """Run AI review using the same analyzer stack as the TUI."""
     from ..services.ai.analyzer import AIAnalyzer
     from .ai_helpers import run_ai_analysis
+    from .display.display_utils import get_ai_provider_display_name
 
     if not project:
         raise ValueError("No active project.")
@@ -1125,15 +1166,7 @@ def run_ai_review(
         if not ai_analyzer.is_configured():
             raise RuntimeError("AI analyzer not configured. Check Settings.")
 
-        provider_names = {
-            "aws": "AWS Bedrock",
-            "anthropic": "Anthropic",
-            "openai": "OpenAI",
-            "ollama": "Ollama",
-            "azure": "Azure OpenAI",
-            "gemini": "Google Gemini",
-        }
-        provider_display = provider_names.get(ai_analyzer.ai_type, ai_analyzer.ai_type.upper())
+        provider_display = get_ai_provider_display_name(ai_analyzer.ai_type)
         callback(f"AI Provider: {provider_display}")
         model_name = getattr(getattr(ai_analyzer, "provider", None), "model_name", None)
         if model_name:
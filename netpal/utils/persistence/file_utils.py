@@ -38,11 +38,14 @@ def save_json(filepath, data, compact=True):
     try:
         ensure_dir(os.path.dirname(filepath))
         
+        # Encode in one shot: json.dump issues a write per token, which
+        # dominates saves of large projects.
+        if compact:
+            payload = json.dumps(data, separators=(',', ':'))
+        else:
+            payload = json.dumps(data, indent=2)
         with open(filepath, 'w') as f:
-            if compact:
-                json.dump(data, f, separators=(',', ':'))
-            else:
-                json.dump(data, f, indent=2)
+            f.write(payload)
         return True
     except (OSError, TypeError, ValueError) as e:
         log.error("Error saving JSON to %s: %s", filepath, e)
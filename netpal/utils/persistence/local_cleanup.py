@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
@@ -24,6 +25,20 @@ LEGACY_REGISTRY_KEYS = {
     "deleted",
 }
 
+# ``(mtime_ns, size)`` of project files last seen clean, and the combined
+# signature of the last clean registry.  The cleanup runs on every registry
+# load, so unchanged files are skipped instead of being parsed again.
+_CLEAN_FILE_SIGNATURES: dict[str, tuple[int, int]] = {}
+_clean_registry_signature: tuple | None = None
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 
 def _load_json(path: Path) -> Any:
     try:
@@ -60,10 +75,25 @@ def cleanup_legacy_local_storage(
         return
 
     # Clean local project files first so registry pruning has current metadata.
-    for project_path in base_dir.glob("*.json"):
-        if project_path.name == "projects.json" or project_path.name.endswith("_findings.json"):
+    # One scandir pass with a suffix check: the scan_results root also holds
+    # every per-project output directory, which glob would match against too.
+    global _clean_registry_signature
+    project_signatures = {}
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            if (
+                entry.name.endswith(".json")
+                and entry.name != "projects.json"
+                and not entry.name.endswith("_findings.json")
+                and entry.is_file()
+            ):
+                st = entry.stat()
+                project_signatures[entry.path] = (st.st_mtime_ns, st.st_size)
+
+    for path_str, signature in project_signatures.items():
+        if _CLEAN_FILE_SIGNATURES.get(path_str) == signature:
             continue
-
+        project_path = Path(path_str)
         project_data = _load_json(project_path)
         if not isinstance(project_data, dict):
             continue
@@ -75,9 +105,20 @@ def cleanup_legacy_local_storage(
         }
         if cleaned_project != project_data:
             _save_json(project_path, cleaned_project)
+            signature = _file_signature(project_path)
+            project_signatures[path_str] = signature
+        _CLEAN_FILE_SIGNATURES[path_str] = signature
 
     registry_path = base_dir / "projects.json"
-    if not registry_path.exists():
+    registry_file_signature = _file_signature(registry_path)
+    if registry_file_signature is None:
+        return
+    registry_signature = (
+        str(registry_path),
+        registry_file_signature,
+        tuple(sorted(project_signatures.items())),
+    )
+    if registry_signature == _clean_registry_signature:
         return
 
     registry = _load_json(registry_path)
@@ -124,3 +165,7 @@ def cleanup_legacy_local_storage(
     cleaned_registry = {"projects": cleaned_projects}
     if cleaned_registry != registry:
         _save_json(registry_path, cleaned_registry)
+        registry_signature = registry_signature[:1] + (
+            _file_signature(registry_path),
+        ) + registry_signature[2:]
+    _clean_registry_signature = registry_signature
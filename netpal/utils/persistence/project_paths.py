@@ -8,6 +8,11 @@ import os
 from pathlib import Path
 
 
+# The package root never moves at runtime, so the scan_results path is
+# built once instead of on every proof path resolved.
+_BASE_SCAN_RESULTS_DIR = str(Path(__file__).parent.parent.parent.parent / "scan_results")
+
+
 def get_base_scan_results_dir() -> str:
     """Get absolute path to scan_results directory.
     
@@ -17,8 +22,7 @@ def get_base_scan_results_dir() -> str:
     Returns:
         Absolute path to scan_results directory
     """
-    package_root = Path(__file__).parent.parent.parent.parent
-    return str(package_root / "scan_results")
+    return _BASE_SCAN_RESULTS_DIR
 
 
 class ProjectPaths:
@@ -86,7 +86,7 @@ def execute_discovery_scan(scanner, asset, project, config, speed=None, callback
         else:
             # Load hosts from file
             with open(resolve_scan_results_path(asset.file), 'r') as f:
-                host_list = [line.strip() for line in f if line.strip()]
+                host_list = [line for line in map(str.strip, f) if line]
             
             nmap_cmd += f" {' '.join(host_list[:3])}{'...' if len(host_list) > 3 else ''}"
             hosts, error = scanner.scan_list(
@@ -210,20 +210,25 @@ def _resolve_project_hosts_for_scan_targets(project, asset, scan_targets):
             candidate_pools.append(asset_hosts)
     candidate_pools.append(list(project.hosts))
 
+    # Index each pool once by scan target and IP (host order preserved)
+    # rather than re-listing every pool for every target.
+    pool_indexes = []
+    for pool in candidate_pools:
+        by_scan_target = {}
+        by_ip = {}
+        for host in pool:
+            by_scan_target.setdefault(host.scan_target, []).append(host)
+            by_ip.setdefault(host.ip, []).append(host)
+        pool_indexes.append((by_scan_target, by_ip))
+
     resolved_hosts = []
     seen_identities = set()
 
     for scan_target in scan_targets:
         matches = []
-        for pool in candidate_pools:
-            exact_matches = [host for host in pool if host.scan_target == scan_target]
-            if exact_matches:
-                matches = exact_matches
-                break
-
-            ip_matches = [host for host in pool if host.ip == scan_target]
-            if ip_matches:
-                matches = ip_matches
+        for by_scan_target, by_ip in pool_indexes:
+            matches = by_scan_target.get(scan_target) or by_ip.get(scan_target) or []
+            if matches:
                 break
 
         for host in matches:
@@ -246,6 +251,8 @@ def _group_scan_targets_by_network(project, asset, scan_targets, fallback_networ
     if not resolved_hosts:
         return [(_normalize_network_id(fallback_network_id), normalized_targets)]
 
+    # Each group is an insertion-ordered dict used as a set, so duplicate
+    # checks stay O(1) on large host lists.
     grouped_targets = {}
     resolved_target_values = set()
 
@@ -254,22 +261,18 @@ def _group_scan_targets_by_network(project, asset, scan_targets, fallback_networ
         if effective_network_id == "unknown":
             effective_network_id = _normalize_network_id(fallback_network_id)
 
-        group = grouped_targets.setdefault(effective_network_id, [])
         scan_target = host.scan_target
-        if scan_target not in group:
-            group.append(scan_target)
+        grouped_targets.setdefault(effective_network_id, {})[scan_target] = None
 
         resolved_target_values.add(scan_target)
         resolved_target_values.add(host.ip)
 
     unresolved_targets = [target for target in normalized_targets if target not in resolved_target_values]
     if unresolved_targets:
-        fallback_group = grouped_targets.setdefault(_normalize_network_id(fallback_network_id), [])
-        for target in unresolved_targets:
-            if target not in fallback_group:
-                fallback_group.append(target)
+        fallback_group = grouped_targets.setdefault(_normalize_network_id(fallback_network_id), {})
+        fallback_group.update(dict.fromkeys(unresolved_targets))
 
-    return list(grouped_targets.items())
+    return [(network_id, list(group)) for network_id, group in grouped_targets.items()]
 
 
 def _select_network_id_for_target(project, asset, target, fallback_network_id="unknown"):
@@ -522,27 +525,36 @@ def execute_recon_scan(scanner, asset, project, target, interface, scan_type, cu
 
 
 def _map_tool_testcases(project, host, exploit_tools, port):
-    """Map tool- and port-level testcase names onto host metadata."""
+    """Map tool- and port-level testcase names onto host metadata.
+
+    Returns:
+        True when any testcase flag was newly set on the host.
+    """
     if not host:
-        return
+        return False
+    changed = False
     try:
         from ...services.testcase.manager import TestCaseManager
 
         registry = TestCaseManager(ConfigLoader.load_config_json()).get_registry(project.project_id)
         if not registry.test_cases:
-            return
-
-        for tool in exploit_tools:
-            tc_id = TestCaseManager.resolve_testcase_for_tool(registry, tool)
-            if tc_id:
-                host.metadata[tc_id] = True
-
-        for recon_type in ConfigLoader.load_recon_types():
-            tc_id = TestCaseManager.resolve_testcase_for_port(registry, recon_type, port)
-            if tc_id:
+            return False
+
+        tc_ids = [
+            TestCaseManager.resolve_testcase_for_tool(registry, tool)
+            for tool in exploit_tools
+        ]
+        tc_ids.extend(
+            TestCaseManager.resolve_testcase_for_port(registry, recon_type, port)
+            for recon_type in ConfigLoader.load_recon_types()
+        )
+        for tc_id in tc_ids:
+            if tc_id and host.metadata.get(tc_id) is not True:
                 host.metadata[tc_id] = True
+                changed = True
     except Exception:
         pass
+    return changed
 
 
 def run_exploit_tools_on_hosts(tool_runner, hosts, asset, exploit_tools, project, callback,
@@ -566,9 +578,14 @@ def run_exploit_tools_on_hosts(tool_runner, hosts, asset, exploit_tools, project
             services (skip Nuclei, nmap scripts, and HTTP tools).
     """
     auto_tool_credentials = ConfigLoader.load_auto_tool_credentials()
+    # Only persist when this run actually changed the project; tool runs
+    # that produce no evidence skip serialising the whole project again.
+    project_dirty = False
+    findings_dirty = False
 
     for host in hosts:
-        project_host = project.get_host_by_identity(host.ip, getattr(host, "network_id", "unknown"))
+        host_network_id = getattr(host, "network_id", "unknown")
+        project_host = project.get_host_by_identity(host.ip, host_network_id)
         host_proof_types_by_port = {}
         if project_host:
             for svc in project_host.services:
@@ -605,8 +622,10 @@ def run_exploit_tools_on_hosts(tool_runner, hosts, asset, exploit_tools, project
                 playwright_only=playwright_only,
             )
             
-            # Add proofs to service
-            project_host = project.get_host_by_identity(host.ip, getattr(host, "network_id", "unknown"))
+            # Add proofs to service.  The project host found above is reused
+            # rather than rescanning project.hosts for every service.
+            if project_host is None:
+                project_host = project.get_host_by_identity(host.ip, host_network_id)
             if project_host:
                 project_service = project_host.get_service(service.port)
                 if project_service:
@@ -625,17 +644,22 @@ def run_exploit_tools_on_hosts(tool_runner, hosts, asset, exploit_tools, project
                             http_file=http_file,
                         )
                         host_proof_types_by_port.setdefault(service.port, set()).add(proof_type)
+                        project_dirty = True
                         
                         # Add findings to host
                         for finding in findings:
                             finding.host_id = project_host.host_id
                             project.add_finding(finding)
+                            findings_dirty = True
 
-            _map_tool_testcases(project, project_host, exploit_tools, service.port)
+            if _map_tool_testcases(project, project_host, exploit_tools, service.port):
+                project_dirty = True
     
-    # Save project with new evidence
-    save_project_callback()
-    save_findings_callback()
+    # Save project with new evidence, once per batch
+    if project_dirty or findings_dirty:
+        save_project_callback()
+    if findings_dirty:
+        save_findings_callback()
 
 
 def scan_and_run_tools_on_discovered_hosts(
@@ -760,38 +784,36 @@ def scan_and_run_tools_on_discovered_hosts(
                 break
         else:
             # Also try matching chunk files already on disk from a previous run
-            for entry in sorted(os.listdir(scan_dir)):
-                if entry.startswith('active_hosts_chunk_') and entry.endswith('.txt'):
-                    entry_stem = entry.replace('.txt', '')
-                    if entry_stem == resume_stem:
-                        # Read the IPs from this existing file and scan them
-                        existing_path = os.path.join(scan_dir, entry)
-                        with open(existing_path, 'r') as fh:
-                            existing_ips = [line.strip() for line in fh if line.strip()]
-                        if callback:
-                            callback(
-                                f"\n[INFO] Resuming from existing chunk file: {entry} "
-                                f"({len(existing_ips)} hosts)\n"
-                            )
-                        hosts, error, _ = execute_recon_scan(
-                            scanner, asset, project, "__ALL_HOSTS__",
-                            interface, scan_type, custom_ports,
-                            speed, skip_discovery, verbose,
-                            exclude, exclude_ports, callback,
-                            host_ips=existing_ips,
-                            chunk_file=existing_path,
-                            network_id=network_id,
-                        )
-                        if hosts:
-                            for h in hosts:
-                                project.add_host(h, asset.asset_id)
-                            save_project_callback()
-                            run_exploit_tools_on_hosts(
-                                tool_runner, hosts, asset, exploit_tools, project,
-                                callback, save_project_callback, save_findings_callback,
-                                rerun_autotools=rerun_autotools,
-                            )
-                        return hosts or []
+            existing_path = _chunk_file_path(scan_dir, resume_stem)
+            if existing_path:
+                entry = os.path.basename(existing_path)
+                # Read the IPs from this existing file and scan them
+                with open(existing_path, 'r') as fh:
+                    existing_ips = [line for line in map(str.strip, fh) if line]
+                if callback:
+                    callback(
+                        f"\n[INFO] Resuming from existing chunk file: {entry} "
+                        f"({len(existing_ips)} hosts)\n"
+                    )
+                hosts, error, _ = execute_recon_scan(
+                    scanner, asset, project, "__ALL_HOSTS__",
+                    interface, scan_type, custom_ports,
+                    speed, skip_discovery, verbose,
+                    exclude, exclude_ports, callback,
+                    host_ips=existing_ips,
+                    chunk_file=existing_path,
+                    network_id=network_id,
+                )
+                if hosts:
+                    for h in hosts:
+                        project.add_host(h, asset.asset_id)
+                    save_project_callback()
+                    run_exploit_tools_on_hosts(
+                        tool_runner, hosts, asset, exploit_tools, project,
+                        callback, save_project_callback, save_findings_callback,
+                        rerun_autotools=rerun_autotools,
+                    )
+                return hosts or []
 
             if callback:
                 callback(f"\n[WARNING] Chunk file '{resume_chunk}' not found — starting from chunk 1\n")
@@ -998,6 +1020,21 @@ def run_discovery_phase(scanner, asset, project, config, speed=None, output_call
 
 # ── Chunk file utilities ───────────────────────────────────────────────────
 
+_CHUNK_PREFIX = 'active_hosts_chunk_'
+
+
+def _chunk_file_path(scan_dir, stem):
+    """Return the path of chunk file *stem* in *scan_dir*, or None.
+
+    Chunk names map straight to ``<stem>.txt``, so a single stat replaces
+    listing the whole scan directory.
+    """
+    if not stem.startswith(_CHUNK_PREFIX) or os.path.basename(stem) != stem:
+        return None
+    chunk_path = os.path.join(scan_dir, f"{stem}.txt")
+    return chunk_path if os.path.isfile(chunk_path) else None
+
+
 def list_chunk_files(project_id, assets):
     """Return a list of chunk file info dicts for a project.
 
@@ -1011,24 +1048,38 @@ def list_chunk_files(project_id, assets):
         List of dicts: ``{asset, stem, path, ip_count}``
     """
     results = []
+    # List the project directory once: an unscanned project (or asset) has
+    # no output directory, so there is nothing to scandir for it.
+    project_dir = get_scan_results_dir(project_id)
+    try:
+        with os.scandir(project_dir) as it:
+            asset_dirs = {entry.name for entry in it if entry.is_dir()}
+    except OSError:
+        return results
     for asset_obj in assets:
         scan_dir = get_scan_results_dir(project_id, asset_obj.get_identifier())
-        if not os.path.isdir(scan_dir):
+        if os.path.dirname(scan_dir) == project_dir and os.path.basename(scan_dir) not in asset_dirs:
             continue
-        for entry in sorted(os.listdir(scan_dir)):
-            if entry.startswith('active_hosts_chunk_') and entry.endswith('.txt'):
-                chunk_path = os.path.join(scan_dir, entry)
-                try:
-                    with open(chunk_path, 'r') as fh:
-                        ip_count = sum(1 for line in fh if line.strip())
-                except Exception:
-                    ip_count = 0
-                results.append({
-                    'asset': asset_obj,
-                    'stem': entry.replace('.txt', ''),
-                    'path': chunk_path,
-                    'ip_count': ip_count,
-                })
+        try:
+            with os.scandir(scan_dir) as it:
+                entries = sorted(
+                    (entry.name, entry.path) for entry in it
+                    if entry.name.startswith(_CHUNK_PREFIX) and entry.name.endswith('.txt')
+                )
+        except OSError:
+            continue
+        for entry, chunk_path in entries:
+            try:
+                with open(chunk_path, 'r') as fh:
+                    ip_count = sum(1 for line in fh if line.strip())
+            except Exception:
+                ip_count = 0
+            results.append({
+                'asset': asset_obj,
+                'stem': entry.replace('.txt', ''),
+                'path': chunk_path,
+                'ip_count': ip_count,
+            })
     return results
 
 
@@ -1046,14 +1097,9 @@ def resolve_chunk_by_name(project_id, assets, chunk_name):
     stem = chunk_name.replace('.txt', '')
     for asset_obj in assets:
         scan_dir = get_scan_results_dir(project_id, asset_obj.get_identifier())
-        if not os.path.isdir(scan_dir):
-            continue
-        for entry in os.listdir(scan_dir):
-            if not entry.startswith('active_hosts_chunk_') or not entry.endswith('.txt'):
-                continue
-            if entry.replace('.txt', '') == stem:
-                chunk_path = os.path.join(scan_dir, entry)
-                with open(chunk_path, 'r') as fh:
-                    ips = [line.strip() for line in fh if line.strip()]
-                return asset_obj, ips, chunk_path
+        chunk_path = _chunk_file_path(scan_dir, stem)
+        if chunk_path:
+            with open(chunk_path, 'r') as fh:
+                ips = [line for line in map(str.strip, fh) if line]
+            return asset_obj, ips, chunk_path
     return None, None, None
@@ -4,13 +4,18 @@
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import os
+import stat
 import threading
 import time
 import uuid
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
 from flask import (
@@ -26,67 +31,108 @@ from flask import (
     url_for,
 )
 
+from netpal.models.finding import SEVERITY_LEVELS
 from netpal.utils import operator_actions as actions
 from netpal.utils.persistence.file_utils import ensure_dir, resolve_scan_results_path
 from netpal.utils.persistence.project_paths import get_base_scan_results_dir
 from netpal.utils.scanning.scan_helpers import list_chunk_files
 
 
+_SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
+_SEVERITY_COLORS = {
+    "critical": "severity-critical",
+    "high": "severity-high",
+    "medium": "severity-medium",
+    "low": "severity-low",
+    "info": "severity-info",
+}
+_PROOF_PREVIEW_CHARS = 5000
+_VERSIONED_FILE_MAX_AGE = 7 * 24 * 3600
+_HOSTS_PAGE_SIZE = 100
+# JSON and file endpoints never render the layout, so they skip loading
+# the active project (job status is polled every second during scans).
+_PROJECT_FREE_ENDPOINTS = frozenset({"static", "job_status", "suggest_path", "serve_file"})
+
+
 def _severity_sort_key(severity: str) -> int:
-    order = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
-    return order.get(str(severity or "").lower(), 5)
+    return _SEVERITY_ORDER.get(str(severity or "").lower(), 5)
 
 
 def _severity_color(severity: str) -> str:
-    colors = {
-        "critical": "severity-critical",
-        "high": "severity-high",
-        "medium": "severity-medium",
-        "low": "severity-low",
-        "info": "severity-info",
-    }
-    return colors.get(str(severity or "").lower(), "severity-info")
+    return _SEVERITY_COLORS.get(str(severity or "").lower(), "severity-info")
+
+
+def _severity_ranks(findings) -> dict[Any, int]:
+    """Map each distinct severity in *findings* to its sort rank.
+
+    Findings share a handful of severities, so sort keys become one dict
+    lookup per finding instead of a normalise-and-lookup call each.
+    """
+    return {severity: _severity_sort_key(severity) for severity in {finding.severity for finding in findings}}
 
 
-def _duplicate_ip_set(project) -> set[str]:
+def _proof_image_url(rel_path: str, version: int | None = None) -> str:
+    """Return a /file URL for a screenshot, versioned by its mtime.
+
+    The version lets the browser keep thumbnails cached across page loads
+    while a re-captured screenshot still gets a fresh URL.  Callers that
+    already stat'ed the file pass its ``st_mtime_ns`` as *version*.
+    """
+    if version is None:
+        try:
+            version = os.stat(resolve_scan_results_path(rel_path)).st_mtime_ns
+        except OSError:
+            return url_for("serve_file", filepath=rel_path)
+    return url_for("serve_file", filepath=rel_path, v=version)
+
+
+def _duplicate_ip_set(project) -> frozenset[str]:
     if not project:
-        return set()
-    seen: dict[str, int] = {}
-    for host in project.hosts:
-        seen[host.ip] = seen.get(host.ip, 0) + 1
-    return {ip for ip, count in seen.items() if count > 1}
+        return frozenset()
+    return project.get_duplicate_ips()
 
 
-def _host_label(host, duplicate_ips: set[str] | None = None) -> str:
-    duplicate_ips = duplicate_ips or set()
-    label = host.ip
-    if host.hostname:
-        label += f" ({host.hostname})"
-    if host.ip in duplicate_ips:
-        label += f" [{getattr(host, 'network_id', 'unknown')}]"
+def _host_label(host, duplicate_ips: frozenset[str] | None = None) -> str:
+    label = f"{host.ip} ({host.hostname})" if host.hostname else host.ip
+    if duplicate_ips and host.ip in duplicate_ips:
+        return f"{label} [{getattr(host, 'network_id', 'unknown')}]"
     return label
 
 
 def _project_metrics(project) -> dict[str, int]:
     if not project:
         return {"assets": 0, "hosts": 0, "services": 0, "findings": 0, "testcases": 0, "proofs": 0}
-    testcase_count = len(actions.get_testcase_manager().get_registry(project.project_id).test_cases)
+    testcase_count = actions.get_testcase_manager().count_test_cases(project.project_id)
+    # Services and proofs are tallied in the same walk over hosts.
+    service_count = 0
+    proof_count = 0
+    for host in project.hosts:
+        service_count += len(host.services)
+        for service in host.services:
+            proof_count += len(service.proofs)
     return {
         "assets": len(project.assets),
         "hosts": len(project.hosts),
-        "services": sum(len(host.services) for host in project.hosts),
+        "services": service_count,
         "findings": len(project.findings),
         "testcases": testcase_count,
-        "proofs": sum(len(service.proofs) for host in project.hosts for service in host.services),
+        "proofs": proof_count,
     }
 
 
+@lru_cache(maxsize=1024)
+def _format_utc_ts(ts) -> str:
+    if not ts:
+        return "N/A"
+    try:
+        return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    except (TypeError, ValueError, OverflowError, OSError):
+        return "N/A"
+
+
 def _decorate_project_registry_entry(entry: dict) -> dict:
     decorated = dict(entry)
-    ts = decorated.get("updated_utc_ts", 0)
-    decorated["updated_str"] = (
-        datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC") if ts else "N/A"
-    )
+    decorated["updated_str"] = _format_utc_ts(decorated.get("updated_utc_ts", 0))
     metadata = decorated.get("metadata", {}) or {}
     decorated["description"] = metadata.get("description", "")
     return decorated
@@ -110,16 +156,20 @@ def _project_rows(active_project_id: str = "") -> list[dict[str, Any]]:
     return rows
 
 
-def _read_text_file(filepath: str) -> str | None:
+def _read_text_file(filepath: str, limit: int = -1) -> str | None:
     try:
         with open(filepath, "r", encoding="utf-8", errors="replace") as handle:
-            return handle.read()
+            return handle.read(limit)
     except OSError:
         return None
 
 
-def _read_jsonl_file(filepath: str) -> list[dict]:
-    results = []
+def _read_jsonl_preview(filepath: str, max_chars: int) -> str:
+    """Render a JSONL file as ``json.dumps(items, indent=2)`` would, but stop
+    reading once the text passes *max_chars* so large result files are not
+    loaded and re-serialized in full just to show a preview."""
+    blocks = []
+    size = 0
     try:
         with open(filepath, "r", encoding="utf-8", errors="replace") as handle:
             for line in handle:
@@ -127,104 +177,63 @@ def _read_jsonl_file(filepath: str) -> list[dict]:
                 if not line:
                     continue
                 try:
-                    results.append(json.loads(line))
+                    item = json.loads(line)
                 except json.JSONDecodeError:
-                    results.append({"raw": line})
+                    item = {"raw": line}
+                block = "  " + json.dumps(item, indent=2).replace("\n", "\n  ")
+                blocks.append(block)
+                size += len(block) + 2
+                if size > max_chars:
+                    break
     except OSError:
         pass
-    return results
-
+    if not blocks:
+        return ""
+    return "[\n" + ",\n".join(blocks) + "\n]"
 
-def _build_project_overview(project) -> dict[str, Any]:
-    hosts = project.hosts
-    findings = sorted(list(project.findings), key=lambda item: _severity_sort_key(item.severity))
-    total_services = sum(len(host.services) for host in hosts)
-    severity_counts: dict[str, int] = {}
-    host_map = {host.host_id: host for host in hosts}
-    screenshots = []
-    seen_ss = set()
-    duplicate_ips = _duplicate_ip_set(project)
 
-    for finding in findings:
-        host = host_map.get(finding.host_id)
-        finding.host_ip = host.ip if host else "Unknown"
-        finding.host_hostname = host.hostname if host else ""
-        finding.host_network_id = getattr(host, "network_id", "unknown") if host else "unknown"
-        severity_counts[finding.severity] = severity_counts.get(finding.severity, 0) + 1
-
-    host_details = []
-    for host in hosts:
-        detail = {
-            "host": host,
-            "label": _host_label(host, duplicate_ips),
-            "services": [],
-        }
+def _screenshot_preview(project, limit: int) -> list[dict[str, Any]]:
+    """Return up to *limit* distinct screenshot proofs in host/service order."""
+    screenshots: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    for host in project.hosts:
         for service in host.services:
-            service_info = {"service": service, "proofs": []}
             for proof in service.proofs:
-                proof_info = {"type": proof.get("type", "unknown"), "files": []}
-                for key in ("result_file", "screenshot_file", "response_file", "http_file"):
-                    rel_path = proof.get(key)
-                    if not rel_path:
-                        continue
-                    full_path = resolve_scan_results_path(rel_path)
-                    if not os.path.isfile(full_path):
-                        continue
-                    ext = os.path.splitext(rel_path)[1].lower()
-                    if ext in {".png", ".jpg", ".jpeg", ".gif", ".webp"}:
-                        proof_info["files"].append({"path": rel_path, "type": "image", "name": os.path.basename(rel_path)})
-                        if key == "screenshot_file" and rel_path not in seen_ss:
-                            screenshots.append(
-                                {
-                                    "file": rel_path,
-                                    "host_ip": host.ip,
-                                    "hostname": host.hostname,
-                                    "port": service.port,
-                                    "service": service.service_name,
-                                }
-                            )
-                            seen_ss.add(rel_path)
-                    elif ext == ".txt":
-                        content = _read_text_file(full_path)
-                        if content and content.strip():
-                            proof_info["files"].append(
-                                {
-                                    "path": rel_path,
-                                    "type": "text",
-                                    "name": os.path.basename(rel_path),
-                                    "content": content,
-                                }
-                            )
-                    elif ext == ".jsonl":
-                        items = _read_jsonl_file(full_path)
-                        if items:
-                            proof_info["files"].append(
-                                {
-                                    "path": rel_path,
-                                    "type": "jsonl",
-                                    "name": os.path.basename(rel_path),
-                                    "content": json.dumps(items, indent=2),
-                                }
-                            )
-                    else:
-                        proof_info["files"].append({"path": rel_path, "type": "file", "name": os.path.basename(rel_path)})
-                if proof_info["files"]:
-                    service_info["proofs"].append(proof_info)
-            detail["services"].append(service_info)
-        host_details.append(detail)
-
-    return {
-        "host_count": len(hosts),
-        "service_count": total_services,
-        "finding_count": len(findings),
-        "severity_counts": severity_counts,
-        "screenshots": screenshots,
-        "host_details": host_details,
-        "findings": findings,
-    }
-
-
-def _project_highlights(project, *, host_limit: int = 6, finding_limit: int = 8) -> dict[str, Any]:
+                rel_path = proof.get("screenshot_file")
+                if not rel_path or rel_path in seen:
+                    continue
+                if os.path.splitext(rel_path)[1].lower() not in {".png", ".jpg", ".jpeg", ".gif", ".webp"}:
+                    continue
+                # One stat both checks the file and versions its URL.
+                try:
+                    st = os.stat(resolve_scan_results_path(rel_path))
+                except OSError:
+                    continue
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                seen.add(rel_path)
+                screenshots.append(
+                    {
+                        "file": rel_path,
+                        "version": st.st_mtime_ns,
+                        "host_ip": host.ip,
+                        "hostname": host.hostname,
+                        "port": service.port,
+                        "service": service.service_name,
+                    }
+                )
+                if len(screenshots) >= limit:
+                    return screenshots
+    return screenshots
+
+
+def _project_highlights(
+    project,
+    *,
+    host_limit: int = 6,
+    finding_limit: int = 8,
+    include_overview: bool = True,
+) -> dict[str, Any]:
     if not project:
         return {
             "asset_rows": [],
@@ -234,10 +243,30 @@ def _project_highlights(project, *, host_limit: int = 6, finding_limit: int = 8)
             "severity_counts": {},
         }
 
-    overview = _build_project_overview(project)
-    duplicate_ips = _duplicate_ip_set(project)
+    # Highlights only need counts and a few previews, so proof files are
+    # not opened here; findings are bucketed in a single Counter pass.
+    # Pages that only show the asset table skip the overview sections.
+    if include_overview:
+        severity_counts = dict(
+            sorted(
+                Counter(finding.severity for finding in project.findings).items(),
+                key=lambda item: _severity_sort_key(item[0]),
+            )
+        )
+        duplicate_ips = _duplicate_ip_set(project)
+
+    # Host rows and per-asset totals come from the same walk over hosts.
+    asset_totals = {asset.asset_id: [0, 0, 0] for asset in project.assets}
     host_rows = []
     for host in project.hosts:
+        for asset_id in set(host.assets):
+            totals = asset_totals.get(asset_id)
+            if totals is not None:
+                totals[0] += 1
+                totals[1] += len(host.services)
+                totals[2] += len(host.findings)
+        if not include_overview:
+            continue
         host_rows.append(
             {
                 "host": host,
@@ -245,21 +274,48 @@ def _project_highlights(project, *, host_limit: int = 6, finding_limit: int = 8)
                 "service_count": len(host.services),
                 "finding_count": len(host.findings),
                 "proof_count": sum(len(service.proofs) for service in host.services),
-                "service_preview": ", ".join(
-                    f"{service.port}/{service.service_name or '?'}"
-                    for service in sorted(host.services, key=lambda item: item.port)[:4]
-                ),
             }
         )
-    top_hosts = sorted(
+
+    asset_rows = []
+    for asset in project.assets:
+        host_count, service_count, finding_count = asset_totals[asset.asset_id]
+        asset_rows.append(
+            {
+                "asset": asset,
+                "host_count": host_count,
+                "service_count": service_count,
+                "finding_count": finding_count,
+            }
+        )
+    if not include_overview:
+        return {
+            "asset_rows": asset_rows,
+            "top_hosts": [],
+            "top_findings": [],
+            "screenshot_preview": [],
+            "severity_counts": {},
+        }
+
+    # Only a handful of hosts and findings are previewed, so select them
+    # with a bounded heap instead of sorting everything.
+    top_hosts = heapq.nlargest(
+        host_limit,
         host_rows,
         key=lambda row: (row["finding_count"], row["service_count"], row["proof_count"], row["label"]),
-        reverse=True,
-    )[:host_limit]
+    )
+    # Service previews are only shown for the top hosts, so only they pay
+    # for sorting their services.
+    for row in top_hosts:
+        row["service_preview"] = ", ".join(
+            f"{service.port}/{service.service_name or '?'}"
+            for service in sorted(row["host"].services, key=lambda item: item.port)[:4]
+        )
 
     host_map = {host.host_id: host for host in project.hosts}
     top_findings = []
-    for finding in overview["findings"][:finding_limit]:
+    rank = _severity_ranks(project.findings)
+    for finding in heapq.nsmallest(finding_limit, project.findings, key=lambda item: rank[item.severity]):
         host = host_map.get(finding.host_id)
         top_findings.append(
             {
@@ -268,24 +324,12 @@ def _project_highlights(project, *, host_limit: int = 6, finding_limit: int = 8)
             }
         )
 
-    asset_rows = []
-    for asset in project.assets:
-        asset_hosts = [host for host in project.hosts if asset.asset_id in host.assets]
-        asset_rows.append(
-            {
-                "asset": asset,
-                "host_count": len(asset_hosts),
-                "service_count": sum(len(host.services) for host in asset_hosts),
-                "finding_count": sum(len(host.findings) for host in asset_hosts),
-            }
-        )
-
     return {
         "asset_rows": asset_rows,
         "top_hosts": top_hosts,
         "top_findings": top_findings,
-        "screenshot_preview": overview["screenshots"][:6],
-        "severity_counts": overview["severity_counts"],
+        "screenshot_preview": _screenshot_preview(project, 6),
+        "severity_counts": severity_counts,
     }
 
 
@@ -298,10 +342,12 @@ def _recon_target_options(project) -> list[tuple[str, str]]:
     if all_hosts:
         options.append((f"All Discovered Hosts ({len(all_hosts)})", "__ALL_DISCOVERED__"))
 
+    # Count hosts per asset in one pass instead of once per asset.
+    asset_host_counts = Counter(asset_id for host in all_hosts for asset_id in set(host.assets))
     for asset in project.assets:
-        asset_hosts = [host for host in project.hosts if asset.asset_id in host.assets]
-        if asset_hosts:
-            options.append((f"Discovered: {asset.name} ({len(asset_hosts)} hosts)", f"__DISCOVERED_ASSET__:{asset.name}"))
+        host_count = asset_host_counts.get(asset.asset_id)
+        if host_count:
+            options.append((f"Discovered: {asset.name} ({host_count} hosts)", f"__DISCOVERED_ASSET__:{asset.name}"))
 
     for asset in project.assets:
         options.append((f"Asset: {asset.name}", f"__ASSET__:{asset.name}"))
@@ -322,22 +368,29 @@ def _tool_target_options(project) -> list[tuple[str, str]]:
         return options
 
     duplicate_ips = _duplicate_ip_set(project)
+    # Tally host/service counts per asset in one pass over the hosts
+    # instead of rescanning every host for each asset option.
     all_hosts = project.hosts
+    service_count = 0
+    asset_totals: dict[int, list[int]] = {}
+    for host in all_hosts:
+        host_services = len(host.services)
+        service_count += host_services
+        for asset_id in set(host.assets):
+            totals = asset_totals.setdefault(asset_id, [0, 0])
+            totals[0] += 1
+            totals[1] += host_services
     if all_hosts:
-        service_count = sum(len(host.services) for host in all_hosts)
         options.append((f"All Discovered ({len(all_hosts)} hosts, {service_count} svc)", "all_discovered"))
 
     for asset in project.assets:
-        asset_hosts = [host for host in project.hosts if asset.asset_id in host.assets]
-        if asset_hosts:
-            service_count = sum(len(host.services) for host in asset_hosts)
-            options.append((f"{asset.name} ({len(asset_hosts)} hosts, {service_count} svc)", f"{asset.name}_discovered"))
+        totals = asset_totals.get(asset.asset_id)
+        if totals:
+            options.append((f"{asset.name} ({totals[0]} hosts, {totals[1]} svc)", f"{asset.name}_discovered"))
 
     for host in sorted(project.hosts, key=lambda item: (item.ip, getattr(item, "network_id", "unknown"))):
         service_list = ", ".join(f"{service.port}/{service.service_name or '?'}" for service in host.services)
-        label = f"{_host_label(host, duplicate_ips)}"
-        label += f" - {service_list}" if service_list else " - no services"
-        options.append((label, f"host-id:{host.host_id}"))
+        options.append((f"{_host_label(host, duplicate_ips)} - {service_list or 'no services'}", f"host-id:{host.host_id}"))
 
     return options
 
@@ -358,27 +411,56 @@ def _tool_options() -> list[tuple[str, str]]:
     return options
 
 
-def _proof_files_for_service(service) -> list[dict[str, Any]]:
-    def _preview_content(content: str, *, max_lines: int = 80, max_chars: int = 5000) -> tuple[str, bool]:
-        lines = content.splitlines()
-        truncated = len(lines) > max_lines
-        preview = "\n".join(lines[:max_lines]) if truncated else content
-        if len(preview) > max_chars:
-            preview = preview[:max_chars].rstrip()
-            truncated = True
-        if truncated:
-            preview = preview.rstrip() + "\n..."
-        return preview, truncated
+def _preview_content(content: str, *, max_lines: int = 80, max_chars: int = _PROOF_PREVIEW_CHARS) -> tuple[str, bool]:
+    # Anything past max_chars is cut regardless, so only that prefix is
+    # split into lines instead of the whole (possibly huge) output.
+    head = content[: max_chars + 1]
+    lines = head.splitlines()
+    truncated = len(lines) > max_lines
+    preview = "\n".join(lines[:max_lines]) if truncated else head
+    if len(preview) > max_chars:
+        preview = preview[:max_chars].rstrip()
+        truncated = True
+    if truncated:
+        preview = preview.rstrip() + "\n..."
+    return preview, truncated
+
+
+@lru_cache(maxsize=256)
+def _cached_proof_preview(full_path: str, ext: str, mtime_ns: int, size: int) -> tuple[str, bool] | None:
+    """Return ``(preview, truncated)`` for a text/JSONL proof, or ``None``.
+
+    *mtime_ns* and *size* are only part of the cache key so a rewritten
+    file is read again; unchanged proofs are not re-read on every visit.
+    """
+    if ext == ".txt":
+        content = _read_text_file(full_path, limit=_PROOF_PREVIEW_CHARS + 1)
+        if not content or not content.strip():
+            return None
+    else:
+        content = _read_jsonl_preview(full_path, _PROOF_PREVIEW_CHARS)
+        if not content:
+            return None
+    return _preview_content(content)
 
+
+def _proof_files_for_service(service) -> list[dict[str, Any]]:
+    proof_keys = ("result_file", "screenshot_file", "response_file", "http_file")
     files = []
     for proof in service.proofs:
         proof_type = proof.get("type", "unknown")
-        for key in ("result_file", "screenshot_file", "response_file", "http_file"):
+        for key in proof_keys:
             rel_path = proof.get(key)
             if not rel_path:
                 continue
             full_path = resolve_scan_results_path(rel_path)
-            if not os.path.isfile(full_path):
+            # One stat checks the file, keys its preview cache and versions
+            # its image URL.
+            try:
+                file_stat = os.stat(full_path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(file_stat.st_mode):
                 continue
             ext = os.path.splitext(rel_path)[1].lower()
             info = {
@@ -389,20 +471,12 @@ def _proof_files_for_service(service) -> list[dict[str, Any]]:
             }
             if ext in {".png", ".jpg", ".jpeg", ".gif", ".webp"}:
                 info["type"] = "image"
-            elif ext == ".txt":
-                content = _read_text_file(full_path)
-                if content and content.strip():
-                    preview, truncated = _preview_content(content)
-                    info["type"] = "text"
-                    info["content"] = preview
-                    info["is_truncated"] = truncated
-            elif ext == ".jsonl":
-                items = _read_jsonl_file(full_path)
-                if items:
-                    preview, truncated = _preview_content(json.dumps(items, indent=2))
-                    info["type"] = "jsonl"
-                    info["content"] = preview
-                    info["is_truncated"] = truncated
+                info["version"] = file_stat.st_mtime_ns
+            elif ext in {".txt", ".jsonl"}:
+                cached = _cached_proof_preview(full_path, ext, file_stat.st_mtime_ns, file_stat.st_size)
+                if cached:
+                    info["type"] = "text" if ext == ".txt" else "jsonl"
+                    info["content"], info["is_truncated"] = cached
             files.append(info)
     return files
 
@@ -433,29 +507,53 @@ def _host_detail_payload(project, host) -> dict[str, Any] | None:
     }
 
 
-def _hosts_table(project) -> list[dict[str, Any]]:
+def _hosts_table(project, page: int = 1, page_size: int = _HOSTS_PAGE_SIZE) -> dict[str, Any]:
+    """Build one page of the hosts inventory.
+
+    Only the visible window is turned into rows, so large projects do not
+    pay for (or render) hundreds of rows the operator cannot see.
+    """
     rows = []
-    if not project:
-        return rows
+    if not project or not project.hosts:
+        return {"rows": rows, "page": 1, "page_count": 1, "total": 0}
     duplicate_ips = _duplicate_ip_set(project)
-    for host in sorted(project.hosts, key=lambda item: (item.ip, getattr(item, "network_id", "unknown"))):
-        asset_name = "-"
-        for asset in project.assets:
-            if asset.asset_id in host.assets:
-                asset_name = asset.name
-                break
+    # One pass over findings instead of a full findings scan per host row.
+    findings_per_host = Counter(finding.host_id for finding in project.findings)
+    # Rank assets once; a host shows the first project asset it belongs to.
+    asset_rank: dict[int, tuple[int, str]] = {}
+    for index, asset in enumerate(project.assets):
+        asset_rank.setdefault(asset.asset_id, (index, asset.name))
+    total = len(project.hosts)
+    page_count = (total + page_size - 1) // page_size
+    page = min(max(page, 1), page_count)
+    start = (page - 1) * page_size
+
+    def sort_key(item):
+        return (item.ip, getattr(item, "network_id", "unknown"))
+
+    # The first page is the common case; a bounded heap avoids sorting the
+    # whole inventory just to show its head.
+    if page == 1:
+        visible = heapq.nsmallest(page_size, project.hosts, key=sort_key)
+    else:
+        visible = sorted(project.hosts, key=sort_key)[start : start + page_size]
+    for host in visible:
+        asset_name = min(
+            (asset_rank[asset_id] for asset_id in host.assets if asset_id in asset_rank),
+            default=(0, "-"),
+        )[1]
         rows.append(
             {
                 "host": host,
                 "label": _host_label(host, duplicate_ips),
                 "network": getattr(host, "network_id", "unknown") or "unknown",
                 "services": len(host.services),
-                "findings": len([finding for finding in project.findings if finding.host_id == host.host_id]),
+                "findings": findings_per_host[host.host_id],
                 "tools": sum(len(service.proofs) for service in host.services),
                 "asset_name": asset_name,
             }
         )
-    return rows
+    return {"rows": rows, "page": page, "page_count": page_count, "total": total}
 
 
 def _host_detail(project, host_id: str | None):
@@ -473,12 +571,19 @@ def _findings_table(project) -> list[dict[str, Any]]:
     if not project:
         return rows
     duplicate_ips = _duplicate_ip_set(project)
-    for finding in sorted(project.findings, key=lambda item: _severity_sort_key(item.severity)):
-        host = project.get_host(finding.host_id) if finding.host_id is not None else None
+    # Label each host once; first host wins for duplicate IDs, matching
+    # Project.get_host().
+    host_labels: dict[int, str] = {}
+    for host in project.hosts:
+        if host.host_id not in host_labels:
+            host_labels[host.host_id] = _host_label(host, duplicate_ips)
+    label_for = host_labels.get
+    rank = _severity_ranks(project.findings)
+    for finding in sorted(project.findings, key=lambda item: rank[item.severity]):
         rows.append(
             {
                 "finding": finding,
-                "host_label": _host_label(host, duplicate_ips) if host else "-",
+                "host_label": label_for(finding.host_id, "-") if finding.host_id is not None else "-",
             }
         )
     return rows
@@ -490,8 +595,9 @@ def _finding_form_data(project) -> dict[str, Any]:
     duplicate_ips = _duplicate_ip_set(project)
     hosts_payload = []
     for host in sorted(project.hosts, key=lambda item: (item.ip, getattr(item, "network_id", "unknown"))):
+        services = sorted(host.services, key=lambda item: item.port)
         proofs = []
-        for service in sorted(host.services, key=lambda item: item.port):
+        for service in services:
             for proof in service.proofs:
                 proof_path = proof.get("result_file") or proof.get("screenshot_file") or proof.get("response_file") or proof.get("http_file") or ""
                 if not proof_path:
@@ -510,7 +616,7 @@ def _finding_form_data(project) -> dict[str, Any]:
                         "value": service.port,
                         "label": f"{service.port}/{service.protocol} ({service.service_name or 'unknown'})",
                     }
-                    for service in sorted(host.services, key=lambda item: item.port)
+                    for service in services
                 ],
                 "proofs": proofs,
             }
@@ -584,13 +690,17 @@ def _save_uploaded_testcase_csv(project, storage) -> str:
     return saved_path
 
 
+JOB_LOG_MAX_LINES = 400
+
+
 @dataclass
 class BackgroundJob:
     job_id: str
     kind: str
     refresh_url: str
     state: str = "pending"
-    logs: list[str] = field(default_factory=list)
+    logs: deque[str] = field(default_factory=lambda: deque(maxlen=JOB_LOG_MAX_LINES))
+    log_total: int = 0
     result: dict[str, Any] | None = None
     error: str = ""
     created_at: float = field(default_factory=time.time)
@@ -603,16 +713,27 @@ class BackgroundJob:
             return
         with self.lock:
             self.logs.append(text)
-            self.logs = self.logs[-400:]
+            self.log_total += 1
             self.updated_at = time.time()
 
-    def snapshot(self) -> dict[str, Any]:
+    def snapshot(self, since: int = 0) -> dict[str, Any]:
+        """Return the job state with the log lines added after *since*.
+
+        Pollers pass back the ``log_total`` they last saw so each poll only
+        carries new output; ``logs_reset`` tells them when the lines replace
+        (rather than extend) what they have.
+        """
         with self.lock:
+            new_count = self.log_total - since
+            reset = since <= 0 or new_count < 0 or new_count >= len(self.logs)
+            logs = list(self.logs) if reset else list(islice(self.logs, len(self.logs) - new_count, None))
             return {
                 "job_id": self.job_id,
                 "kind": self.kind,
                 "state": self.state,
-                "logs": list(self.logs),
+                "logs": logs,
+                "logs_reset": reset,
+                "log_total": self.log_total,
                 "result": self.result,
                 "error": self.error,
                 "refresh_url": self.refresh_url,
@@ -671,12 +792,16 @@ def create_app(test_config: dict[str, Any] | None = None) -> Flask:
     app.job_store = job_store  # type: ignore[attr-defined]
     app.jinja_env.globals.update(
         severity_color=_severity_color,
+        proof_image_url=_proof_image_url,
+        severity_levels=SEVERITY_LEVELS,
         credential_type_label=actions.credential_type_label,
         boolish=actions.boolish,
     )
 
     @app.before_request
     def _load_request_state() -> None:
+        if request.endpoint in _PROJECT_FREE_ENDPOINTS:
+            return
         g.config = actions.load_config()
         g.active_project = actions.load_active_project_with_findings(g.config)
         g.allowed_views = actions.allowed_views(g.active_project)
@@ -730,6 +855,7 @@ def create_app(test_config: dict[str, Any] | None = None) -> Flask:
             "rerun_autotools_options": actions.RERUN_AUTOTOOLS_OPTIONS,
             "credential_type_options": actions.AUTO_TOOL_CREDENTIAL_TYPE_OPTIONS,
             "ad_output_type_options": actions.AD_OUTPUT_TYPE_OPTIONS,
+            "job_log_max_lines": JOB_LOG_MAX_LINES,
         }
 
     @app.route("/")
@@ -830,7 +956,7 @@ def create_app(test_config: dict[str, Any] | None = None) -> Flask:
             "assets.html",
             project=project,
             project_metrics=_project_metrics(project),
-            project_highlights=_project_highlights(project),
+            project_highlights=_project_highlights(project, include_overview=False),
         )
 
     @app.route("/project/<project_id>")
@@ -855,7 +981,7 @@ def create_app(test_config: dict[str, Any] | None = None) -> Flask:
             "assets.html",
             project=project,
             project_metrics=_project_metrics(project),
-            project_highlights=_project_highlights(project),
+            project_highlights=_project_highlights(project, include_overview=False),
         )
 
     @app.route("/assets/create", methods=["POST"])
@@ -1037,9 +1163,13 @@ def create_app(test_config: dict[str, Any] | None = None) -> Flask:
         selected_host = _host_detail(g.active_project, selected_host_id) if selected_host_id else None
         if not selected_host and g.active_project and g.active_project.hosts:
             selected_host = g.active_project.hosts[0]
+        table = _hosts_table(g.active_project, request.args.get("page", 1, type=int))
         return render_template(
             "hosts.html",
-            rows=_hosts_table(g.active_project),
+            rows=table["rows"],
+            page=table["page"],
+            page_count=table["page_count"],
+            host_total=table["total"],
             selected_host=selected_host,
             selected_host_detail=_host_detail_payload(g.active_project, selected_host),
             duplicate_ips=_duplicate_ip_set(g.active_project),
@@ -1056,10 +1186,10 @@ def create_app(test_config: dict[str, Any] | None = None) -> Flask:
         if g.active_project and selected_finding_id:
             selected_finding = next((item for item in g.active_project.findings if item.finding_id == selected_finding_id), None)
         if not selected_finding and g.active_project and g.active_project.findings:
-            selected_finding = sorted(
+            selected_finding = min(
                 g.active_project.findings,
                 key=lambda item: _severity_sort_key(item.severity),
-            )[0]
+            )
         return render_template(
             "findings.html",
             rows=_findings_table(g.active_project),
@@ -1340,7 +1470,7 @@ def create_app(test_config: dict[str, Any] | None = None) -> Flask:
         job = job_store.get(job_id)
         if not job:
             abort(404)
-        return jsonify(job.snapshot())
+        return jsonify(job.snapshot(since=request.args.get("since", 0, type=int)))
 
     @app.route("/api/suggest-path")
     def suggest_path():
@@ -1355,7 +1485,9 @@ def create_app(test_config: dict[str, Any] | None = None) -> Flask:
             abort(403)
         if not os.path.isfile(full_path):
             abort(404)
-        return send_file(full_path)
+        # Versioned URLs (see _proof_image_url) change whenever the file does.
+        max_age = _VERSIONED_FILE_MAX_AGE if request.args.get("v") else None
+        return send_file(full_path, max_age=max_age)
 
     return app
 
@@ -39,6 +39,55 @@ class ConfigLoaderTests(unittest.TestCase):
             with open(creds_path, "r", encoding="utf-8") as fh:
                 self.assertEqual(json.load(fh), example_data)
 
+    def test_load_exploit_tools_reuses_parse_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tools_path = os.path.join(tmpdir, "exploit_tools.json")
+            with open(tools_path, "w", encoding="utf-8") as fh:
+                json.dump([{"tool_name": "first", "port": [80]}], fh)
+
+            with mock.patch.object(ConfigLoader, "get_config_path", return_value=tools_path):
+                first = ConfigLoader.load_exploit_tools()
+                first[0]["tool_name"] = "mutated"
+
+                with mock.patch("netpal.utils.config_loader.json.load") as json_load:
+                    second = ConfigLoader.load_exploit_tools()
+                    json_load.assert_not_called()
+                self.assertEqual(second, [{"tool_name": "first", "port": [80]}])
+
+                with open(tools_path, "w", encoding="utf-8") as fh:
+                    json.dump([{"tool_name": "second", "port": [443, 8443]}], fh)
+                os.utime(tools_path, ns=(0, 0))
+
+                third = ConfigLoader.load_exploit_tools()
+
+            self.assertEqual(third, [{"tool_name": "second", "port": [443, 8443]}])
+
+    def test_saved_creds_are_private_and_keep_existing_mode(self):
+        from netpal.utils import operator_actions as actions
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            creds_path = os.path.join(tmpdir, "creds.json")
+            with mock.patch.object(ConfigLoader, "get_config_path", return_value=creds_path):
+                self.assertTrue(actions.save_settings_document("creds.json", [{"username": "a"}]))
+                self.assertEqual(os.stat(creds_path).st_mode & 0o777, 0o600)
+
+                os.chmod(creds_path, 0o640)
+                self.assertTrue(actions.save_settings_document("creds.json", [{"username": "b"}]))
+                self.assertEqual(os.stat(creds_path).st_mode & 0o777, 0o640)
+            with open(creds_path, "r", encoding="utf-8") as fh:
+                self.assertEqual(json.load(fh), [{"username": "b"}])
+
+    def test_failed_settings_save_leaves_no_temp_file(self):
+        from netpal.utils import operator_actions as actions
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            creds_path = os.path.join(tmpdir, "creds.json")
+            with mock.patch.object(ConfigLoader, "get_config_path", return_value=creds_path):
+                with mock.patch("netpal.utils.operator_actions.os.replace", side_effect=OSError("disk full")):
+                    self.assertFalse(actions.save_settings_document("creds.json", [{"username": "a"}]))
+
+            self.assertEqual(os.listdir(tmpdir), [])
+
 
 if __name__ == "__main__":
     unittest.main()
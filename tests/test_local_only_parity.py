@@ -1,4 +1,5 @@
 import csv
+import json
 import logging
 import os
 import sys
@@ -223,6 +224,49 @@ class LocalOnlyParityTests(unittest.TestCase):
         self.assertEqual(sorted(service.port for service in merged.services), [80, 443])
         self.assertEqual(merged.scan_target, "web-a")
 
+    def test_host_service_lookup_tracks_appends_and_replaced_lists(self):
+        host = Host("10.0.0.10", services=[Service(80, proofs=[{"type": "playwright"}])])
+        self.assertIs(host.get_service(80), host.services[0])
+
+        host.add_service(Service(80, proofs=[{"type": "nuclei"}]))
+        host.add_service(Service(443))
+        self.assertEqual([service.port for service in host.services], [80, 443])
+        self.assertEqual([proof["type"] for proof in host.get_service(80).proofs], ["playwright", "nuclei"])
+        self.assertIs(host.get_service(443), host.services[1])
+
+        replacement = Service(22)
+        host.services = [replacement]
+        self.assertIsNone(host.get_service(80))
+        self.assertIs(host.get_service(22), replacement)
+
+    def test_legacy_cleanup_skips_unchanged_files_and_rechecks_rewrites(self):
+        from netpal.utils.persistence import local_cleanup
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = os.path.join(tmpdir, "scan_results")
+            os.makedirs(base)
+            project_path = os.path.join(base, "p1.json")
+            with open(project_path, "w", encoding="utf-8") as fh:
+                json.dump({"name": "One", "cloud_sync": True}, fh)
+            with open(os.path.join(base, "projects.json"), "w", encoding="utf-8") as fh:
+                json.dump({"projects": [{"id": "p1", "name": "One", "cloud_sync": True}]}, fh)
+
+            local_cleanup.cleanup_legacy_local_storage(scan_results_dir=local_cleanup.Path(base))
+            with open(project_path, encoding="utf-8") as fh:
+                self.assertNotIn("cloud_sync", json.load(fh))
+
+            with mock.patch.object(local_cleanup, "_load_json", wraps=local_cleanup._load_json) as load_json:
+                local_cleanup.cleanup_legacy_local_storage(scan_results_dir=local_cleanup.Path(base))
+            load_json.assert_not_called()
+
+            with open(project_path, "w", encoding="utf-8") as fh:
+                json.dump({"name": "One renamed", "cloud_sync": False}, fh)
+            local_cleanup.cleanup_legacy_local_storage(scan_results_dir=local_cleanup.Path(base))
+            with open(project_path, encoding="utf-8") as fh:
+                self.assertEqual(json.load(fh), {"name": "One renamed"})
+            with open(os.path.join(base, "projects.json"), encoding="utf-8") as fh:
+                self.assertEqual(json.load(fh)["projects"][0]["name"], "One renamed")
+
     def test_recon_xml_promotes_ad_domain_and_host_metadata_without_overwriting(self):
         xml_content = """<?xml version="1.0"?>
 <nmaprun>
@@ -340,6 +384,24 @@ class LocalOnlyParityTests(unittest.TestCase):
             self.assertIn("Interesting banner", service_context["evidence_samples"][0]["content"])
             self.assertEqual(service_context["screenshots"][0]["path"], screenshot_path)
 
+            with open(result_path, "a", encoding="utf-8") as handle:
+                handle.write("\nNew evidence line")
+            refreshed = ContextBuilder().build_context([host], include_evidence=True)
+            self.assertIn(
+                "New evidence line",
+                refreshed["hosts"][0]["services"][0]["evidence_samples"][0]["content"],
+            )
+            with mock.patch("netpal.services.ai.context_builder.open", create=True, side_effect=AssertionError):
+                reused = ContextBuilder().build_context([host], include_evidence=True)
+            self.assertEqual(reused, refreshed)
+
+            events = []
+            ContextBuilder(lambda kind, data: events.append((kind, data["port"], data["file"]))).build_context([host])
+            self.assertEqual(
+                events,
+                [("reading_file", 443, rel_result), ("reading_file", 443, screenshot_path)],
+            )
+
     def test_finding_create_and_delete_updates_host_reverse_refs(self):
         with tempfile.TemporaryDirectory() as tmpdir, patched_scan_results(tmpdir):
             project = Project(name="Findings", project_id="NETP-TEST-FIND")
@@ -413,6 +475,7 @@ class LocalOnlyParityTests(unittest.TestCase):
 
             project = Project(name="TC", project_id="NETP-TEST-TC")
             manager = TestCaseManager({})
+            self.assertEqual(manager.count_test_cases(project.project_id), 0)
 
             load_result = manager.load_test_cases(project, csv_path=csv_path)
             self.assertEqual(load_result["total"], 2)
@@ -420,6 +483,7 @@ class LocalOnlyParityTests(unittest.TestCase):
 
             registry = manager.get_registry(project.project_id)
             self.assertEqual(len(registry.test_cases), 2)
+            self.assertEqual(manager.count_test_cases(project.project_id), 2)
 
             first_id = sorted(registry.test_cases)[0]
             update_result = manager.set_result(project.project_id, first_id, "passed", "Validated manually")
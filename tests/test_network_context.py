@@ -64,6 +64,18 @@ class NetworkContextTests(unittest.TestCase):
         self.assertIsNotNone(merged)
         self.assertEqual(sorted(service.port for service in merged.services), [80, 443])
 
+    def test_duplicate_ips_track_added_and_pruned_hosts(self):
+        project = Project(name="Duplicate IPs")
+        project.add_host(Host("10.0.0.5", network_id="gateway:10.0.0.1"))
+        project.add_host(Host("10.0.0.6", network_id="gateway:10.0.0.1"))
+        self.assertEqual(project.get_duplicate_ips(), frozenset())
+
+        project.add_host(Host("10.0.0.5", network_id="gateway:10.0.10.1"))
+        self.assertEqual(project.get_duplicate_ips(), frozenset({"10.0.0.5"}))
+
+        project.hosts = [host for host in project.hosts if host.network_id == "gateway:10.0.0.1"]
+        self.assertEqual(project.get_duplicate_ips(), frozenset())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,15 @@
+import json
+import subprocess
+import sys
+import threading
+import time
 import unittest
+from unittest import mock
 
 from netpal.models.host import Host
 from netpal.models.service import Service
 from netpal.services.tools.base import BaseToolRunner
+from netpal.services.tools.nuclei_runner import NucleiRunner
 from netpal.services.tools.tool_orchestrator import ToolOrchestrator
 
 
@@ -99,6 +106,18 @@ class ToolCommandTemplateTests(unittest.TestCase):
         self.assertIn("***", rendered)
         self.assertNotIn("TopSecret!", rendered)
 
+    def test_placeholder_values_are_not_expanded_again(self):
+        host = Host("10.10.10.161")
+
+        command = self.runner._render_command_args(
+            'tool -p "{password}" {ip}:{port}',
+            host,
+            self.service,
+            credential={"username": "u", "password": "{ip}{port}", "type": "all"},
+        )
+
+        self.assertEqual(command, ["tool", "-p", "{ip}{port}", "10.10.10.161:389"])
+
     def test_build_tool_runs_filters_enabled_credentials_by_type(self):
         tool = {
             "tool_name": "SMB Auth Check",
@@ -281,6 +300,106 @@ class ToolCommandTemplateTests(unittest.TestCase):
         self.assertEqual(executed, ["Web Fingerprint"])
         self.assertEqual(len(results), 1)
 
+    def test_parallel_auto_tools_keep_config_order_and_survive_a_failing_tool(self):
+        host = Host("10.10.10.161")
+        service = Service(port=80, service_name="http")
+        orchestrator = ToolOrchestrator("NETP-TEST-0001", {"auto_tool_workers": 2})
+        orchestrator.playwright.can_run_on_service = lambda svc: False
+        self.assertEqual(orchestrator.max_workers, 2)
+
+        both_running = threading.Barrier(2, timeout=5)
+
+        def _fake_execute(tool, host_obj, service_obj, asset_identifier, pw_result_file, callback=None, project_domain=None):
+            both_running.wait()
+            name = tool["tool_name"]
+            if name == "Broken":
+                raise RuntimeError("tool crashed")
+            if name == "Slow":
+                time.sleep(0.1)
+            callback(f"{name} done\n")
+            return (f"command_{name.lower()}", None, None, [], None, None)
+
+        orchestrator._execute_configured_tool = _fake_execute
+
+        def _tool(name):
+            return {"port": [80], "service_name": [], "tool_name": name, "tool_type": "command_custom", "command": "echo {ip}"}
+
+        messages = []
+        results = orchestrator.execute_tools_for_service(
+            host, service, "WEB", [_tool("Slow"), _tool("Fast")], callback=messages.append,
+        )
+        self.assertEqual([result[0] for result in results], ["command_slow", "command_fast"])
+        self.assertEqual(messages, ["Fast done\n", "Slow done\n"])
+
+        messages = []
+        results = orchestrator.execute_tools_for_service(
+            host, service, "WEB", [_tool("Broken"), _tool("Fast")], callback=messages.append,
+        )
+        self.assertEqual([result[0] for result in results], ["command_fast"])
+        joined = "".join(messages)
+        self.assertIn("[ERROR] Broken failed on 10.10.10.161:80: tool crashed", joined)
+        self.assertIn("Fast done", joined)
+
+    def test_match_tools_for_service_keeps_config_order_across_port_and_name_hits(self):
+        orchestrator = ToolOrchestrator("NETP-TEST-0001", {})
+        exploit_tools = [
+            {"tool_name": "Name Match", "port": [], "service_name": ["HTTP"]},
+            {"tool_name": "SMB Only", "port": [445], "service_name": ["microsoft-ds"]},
+            {"tool_name": "Port And Name", "port": [8080], "service_name": ["http-proxy"]},
+        ]
+
+        matches = orchestrator.match_tools_for_service(8080, "http-proxy", exploit_tools)
+        self.assertEqual([tool["tool_name"] for tool in matches], ["Name Match", "Port And Name"])
+
+        matches = orchestrator.match_tools_for_service(445, None, exploit_tools)
+        self.assertEqual([tool["tool_name"] for tool in matches], ["SMB Only"])
+
+        # A same-length, in-place edit must not reuse the stale index.
+        exploit_tools[1] = {"tool_name": "SSH Only", "port": [22], "service_name": ["ssh"]}
+        self.assertEqual(orchestrator.match_tools_for_service(445, None, exploit_tools), [])
+        matches = orchestrator.match_tools_for_service(22, None, exploit_tools)
+        self.assertEqual([tool["tool_name"] for tool in matches], ["SSH Only"])
+
+    def test_nuclei_streaming_reports_each_match_and_honours_timeout(self):
+        runner = NucleiRunner("NETP-TEST-0001", {})
+        match = json.dumps({"template-id": "tech-detect", "matched-at": "http://10.0.0.5:80", "info": {"severity": "info"}})
+        lines = []
+
+        return_code = runner._run_streaming(
+            [sys.executable, "-c", f"print({match!r}); print('plain line')"],
+            lines.append,
+            timeout=30,
+        )
+
+        self.assertEqual(return_code, 0)
+        self.assertEqual(lines, ["[NUCLEI] [info] tech-detect http://10.0.0.5:80\n", "plain line\n"])
+        with self.assertRaises(subprocess.TimeoutExpired):
+            runner._run_streaming([sys.executable, "-c", "import time; time.sleep(30)"], lines.append, timeout=0.2)
+
+    def test_nuclei_streaming_kills_scan_when_callback_raises(self):
+        runner = NucleiRunner("NETP-TEST-0001", {})
+        started = []
+
+        def _failing_callback(line):
+            raise RuntimeError("log closed")
+
+        real_popen = subprocess.Popen
+
+        def _tracking_popen(*args, **kwargs):
+            started.append(real_popen(*args, **kwargs))
+            return started[-1]
+
+        with mock.patch("netpal.services.tools.nuclei_runner.subprocess.Popen", side_effect=_tracking_popen):
+            with self.assertRaises(RuntimeError):
+                runner._run_streaming(
+                    [sys.executable, "-c", "import time; print('x', flush=True); time.sleep(30)"],
+                    _failing_callback,
+                    timeout=30,
+                )
+
+        self.assertIsNotNone(started[0].poll())
+        self.assertTrue(started[0].stdout.closed)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -41,6 +41,25 @@ class TUIViewSmokeTests(unittest.IsolatedAsyncioTestCase):
                 projects_button = app.query_one("#nav-view-projects", TextAction)
                 self.assertTrue(projects_button.has_class("active-tab"))
 
+    async def test_refilled_table_columns_shrink_after_long_values_leave(self):
+        from netpal.textual_ui.helpers import _fill_table
+
+        with mock.patch("netpal.textual_ui.app._list_projects", return_value=[]):
+            app = NetPalApp()
+            app.config["project_name"] = ""
+
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                columns = ("Name", "ID")
+                view = app.query_one(ProjectsView)
+                table = _fill_table(view, "proj-table", columns, [("a", ("x" * 60, "1"))])
+                await pilot.pause()
+                self.assertEqual(table.ordered_columns[0].content_width, 60)
+
+                table = _fill_table(view, "proj-table", columns, [("b", ("short", "2"))])
+                await pilot.pause()
+                self.assertEqual(table.ordered_columns[0].content_width, len("short"))
+
     async def test_navigation_unlocks_progressively_from_project_state(self):
         with mock.patch("netpal.textual_ui.app._list_projects", return_value=[]):
             app = NetPalApp()
@@ -178,6 +197,7 @@ class TUIViewSmokeTests(unittest.IsolatedAsyncioTestCase):
             return_value=[{"name": "Demo", "id": "P1", "external_id": "", "ad_domain": ""}],
         ), mock.patch("netpal.textual_ui.app._get_testcase_manager") as get_testcase_manager:
             get_testcase_manager.return_value.get_registry.return_value = registry
+            get_testcase_manager.return_value.count_test_cases.return_value = len(registry.test_cases)
             app = NetPalApp()
             app.config["project_name"] = "Demo"
 
@@ -625,5 +645,31 @@ class TUIViewSmokeTests(unittest.IsolatedAsyncioTestCase):
                 findings_table.action_select_cursor()
                 await pilot.pause()
                 self.assertGreater(app.query_one("#finding-detail-panel", RichLog).max_scroll_y, 0)
+
+
+class BatchedLogWriterTests(unittest.TestCase):
+    def test_timer_flush_and_worker_flush_deliver_in_order(self):
+        import threading
+        import time
+
+        from netpal.textual_ui.helpers import _BatchedLogWriter
+
+        delivered = []
+
+        def _slow_call_from_thread(func, log, lines):
+            # The timer's batch is still being handed over when the worker flushes.
+            if threading.current_thread() is not threading.main_thread():
+                time.sleep(0.1)
+            delivered.extend(lines)
+
+        writer = _BatchedLogWriter(SimpleNamespace(call_from_thread=_slow_call_from_thread), None, interval=0.02)
+        writer("first")
+        time.sleep(0.05)
+        writer("second")
+        writer.flush()
+
+        self.assertEqual(delivered, ["first", "second"])
+
+
 if __name__ == "__main__":
     unittest.main()
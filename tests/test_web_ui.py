@@ -380,6 +380,21 @@ class WebUITests(unittest.TestCase):
         self.assertIn("2 Proofs", page)
         self.assertIn("Preview truncated. Open file for the full output.", page)
 
+    def test_hosts_page_paginates_large_inventories(self):
+        seeded = self._seed_project()
+        for index in range(1, 120):
+            seeded.project.add_host(Host(f"10.0.1.{index}", network_id="unknown"), seeded.asset.asset_id)
+        save_project_to_file(seeded.project)
+
+        first = self.client.get("/hosts").get_data(as_text=True)
+        self.assertIn("Page 1 of 2 (120 hosts)", first)
+        self.assertIn("10.0.0.10", first)
+        self.assertNotIn(">10.0.1.99<", first)
+
+        second = self.client.get("/hosts?page=2").get_data(as_text=True)
+        self.assertIn("Page 2 of 2 (120 hosts)", second)
+        self.assertIn(">10.0.1.99<", second)
+
     def test_testcase_load_and_update_routes_persist_registry(self):
         seeded = self._seed_project()
         csv_buffer = io.StringIO()
@@ -447,11 +462,47 @@ class WebUITests(unittest.TestCase):
         response = self.client.get(f"/file/{seeded.proof_rel}")
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.get_data(as_text=True), "proof data")
+        self.assertNotIn("max-age=", response.headers.get("Cache-Control", ""))
+        response.close()
+
+        response = self.client.get(f"/file/{seeded.proof_rel}?v=1")
+        self.assertIn("max-age=", response.headers.get("Cache-Control", ""))
         response.close()
 
         response = self.client.get("/file/..%2Foutside.txt")
         self.assertEqual(response.status_code, 403)
 
+    def test_job_snapshot_returns_only_lines_after_since(self):
+        from netpalui.app import JOB_LOG_MAX_LINES, BackgroundJob
+
+        job = BackgroundJob(job_id="job-1", kind="recon", refresh_url="/recon")
+        for idx in range(3):
+            job.append_log(f"line {idx}")
+
+        first = job.snapshot()
+        self.assertTrue(first["logs_reset"])
+        self.assertEqual(first["logs"], ["line 0", "line 1", "line 2"])
+        self.assertEqual(first["log_total"], 3)
+
+        job.append_log("line 3")
+        update = job.snapshot(since=first["log_total"])
+        self.assertFalse(update["logs_reset"])
+        self.assertEqual(update["logs"], ["line 3"])
+        self.assertEqual(job.snapshot(since=4)["logs"], [])
+
+        for idx in range(JOB_LOG_MAX_LINES):
+            job.append_log(f"burst {idx}")
+        behind = job.snapshot(since=4)
+        self.assertTrue(behind["logs_reset"])
+        self.assertEqual(len(behind["logs"]), JOB_LOG_MAX_LINES)
+
+    def test_job_status_poll_skips_active_project_load(self):
+        job = self.app.job_store.create("recon", "/recon", lambda **kwargs: None)
+        with mock.patch("netpalui.app.actions.load_active_project_with_findings") as load_project:
+            response = self.client.get(f"/jobs/{job.job_id}/status")
+        self.assertEqual(response.status_code, 200)
+        load_project.assert_not_called()
+
     def test_background_job_routes_cover_success_and_failure_states(self):
         self._seed_project()
 